@@ -0,0 +1,259 @@
+"""Measure how fast teek's Python <--> Tcl stuff is.
+
+Run ``python -m benchmarks --help`` from the directory that contains the
+benchmarks directory for usage.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import timeit
+
+import teek
+from teek._tcl_calls import from_tcl, to_tcl
+
+
+# each benchmark is a function that sets up things and returns a function to
+# time, and the timed function should do the thing once
+_benchmarks = {}
+
+
+def benchmark(func):
+    _benchmarks[func.__name__] = func
+    return func
+
+
+def _make_tcl_call_benchmark(returntype, *args):
+    def setup():
+        return lambda: teek.tcl_call(returntype, *args)
+    return setup
+
+
+for _name, _returntype, _args in [
+        ('tcl_call_none', None, ['set', 'benchmark_var', 'hello']),
+        ('tcl_call_str', str, ['set', 'benchmark_var']),
+        ('tcl_call_int', int, ['expr', '1 + 2']),
+        ('tcl_call_float', float, ['expr', '1.5 + 2']),
+        ('tcl_call_bool', bool, ['expr', '1 == 2']),
+        ('tcl_call_str_list', [str], ['list', 'a', 'b', 'c', 'd', 'e']),
+        ('tcl_call_int_list', [int], ['list'] + list(range(100))),
+        ('tcl_call_dict', {'a': int}, ['dict', 'create', 'a', 1, 'b', 2])]:
+    _benchmarks[_name] = _make_tcl_call_benchmark(_returntype, *_args)
+
+
+@benchmark
+def to_tcl_str():
+    return lambda: to_tcl('hello')
+
+
+@benchmark
+def to_tcl_coords():
+    coords = [1.5, 2] * 1000
+    return lambda: to_tcl(coords)
+
+
+@benchmark
+def to_tcl_mixed_list():
+    mixed = ['a', 1, None, True, 2.5] * 20
+    return lambda: to_tcl(mixed)
+
+
+@benchmark
+def to_tcl_widget():
+    label = teek.Label(teek.Window())
+    return lambda: to_tcl(label)
+
+
+@benchmark
+def from_tcl_str():
+    return lambda: from_tcl(str, 'hello')
+
+
+@benchmark
+def from_tcl_int_list():
+    numbers = ' '.join(map(str, range(100)))
+    return lambda: from_tcl([int], numbers)
+
+
+@benchmark
+def from_tcl_tuple_spec():
+    return lambda: from_tcl((str, int, bool), 'hello 123 yes')
+
+
+@benchmark
+def widget_create_destroy():
+    window = teek.Window()
+    return lambda: teek.Label(window, 'hello').destroy()
+
+
+@benchmark
+def config_get():
+    label = teek.Label(teek.Window(), 'hello')
+    return lambda: label.config['text']
+
+
+@benchmark
+def config_set():
+    label = teek.Label(teek.Window(), 'hello')
+
+    def set_text():
+        label.config['text'] = 'world'
+
+    return set_text
+
+
+@benchmark
+def bind_dispatch():
+    widget = teek.Frame(teek.Window())
+    widget.bind('<<BenchmarkEvent>>', lambda event: None, event=True)
+    return lambda: teek.tcl_call(
+        None, 'event', 'generate', widget, '<<BenchmarkEvent>>')
+
+
+@benchmark
+def after_idle():
+    return lambda: (teek.after_idle(lambda: None),
+                    teek.update(idletasks_only=True))
+
+
+@benchmark
+def thread_call():
+    # the thread does all calls in one go, so this returns the time for all
+    # of them, see _run_thread_benchmark()
+    def do_calls(how_many):
+        for i in range(how_many):
+            teek.tcl_call(None, 'set', 'benchmark_var', 'hello')
+
+    return do_calls
+
+
+def _run_thread_benchmark(do_calls, number):
+    # init_threads() can't be called twice, and teek.quit() resets that
+    if sys.platform == 'win32':
+        teek.init_threads()
+    else:
+        teek.init_threads(poll_interval_ms=None)
+
+    result = []
+
+    def thread_target():
+        start = timeit.default_timer()
+        do_calls(number)
+        result.append(timeit.default_timer() - start)
+        teek.after_idle(teek.quit)
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+    teek.run()
+    thread.join()
+    return result[0]
+
+
+def run_benchmark(name, number, repeat):
+    """Return the fastest time of one call in seconds."""
+    func = _benchmarks[name]()
+    try:
+        if name == 'thread_call':
+            times = [_run_thread_benchmark(func, number)
+                     for junk in range(repeat)]
+        else:
+            times = timeit.repeat(func, number=number, repeat=repeat)
+        return min(times) / number
+    finally:
+        # cleans up the widgets and stuff
+        teek.quit()
+
+
+def compare(old_results, new_results, threshold):
+    print('%-25s %12s %12s %8s' % ('benchmark', 'old (us)', 'new (us)',
+                                   'change'))
+    slower = []
+    for name in sorted(old_results.keys() & new_results.keys()):
+        old = old_results[name]
+        new = new_results[name]
+        change = (new - old) / old
+        print('%-25s %12.2f %12.2f %+7.1f%%' % (
+            name, old * 1e6, new * 1e6, change * 100))
+        if change > threshold:
+            slower.append(name)
+
+    if slower:
+        print()
+        print("slower by more than %.0f%%: %s"
+              % (threshold * 100, ', '.join(slower)))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description=(
+            "Run benchmarks. This creates windows, so use e.g. xvfb-run to "
+            "run this without a display."))
+    parser.add_argument(
+        'names', nargs='*', metavar='NAME',
+        help="benchmarks to run, default is all of them")
+    parser.add_argument(
+        '--list', action='store_true', help="print benchmark names and exit")
+    parser.add_argument(
+        '--number', type=int, default=1000,
+        help="how many times to run each benchmark in a row (default: 1000)")
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help="how many times to repeat the running, fastest time is used "
+             "(default: 5)")
+    parser.add_argument(
+        '--output', metavar='FILE', help="save results to a JSON file")
+    parser.add_argument(
+        '--compare', metavar='OLD_FILE',
+        help="compare results with a JSON file from --output and exit with "
+             "status 1 if something got slower")
+    parser.add_argument(
+        '--threshold', type=float, default=10,
+        help="with --compare, how many percents slower is too slow "
+             "(default: 10)")
+    parser.add_argument(
+        '--new', metavar='NEW_FILE',
+        help="with --compare, compare with this file instead of running the "
+             "benchmarks")
+    args = parser.parse_args()
+
+    if args.list:
+        for name in sorted(_benchmarks):
+            print(name)
+        return
+
+    if args.compare is not None and args.new is not None:
+        with open(args.new, 'r') as file:
+            results = json.load(file)['results']
+    else:
+        for name in args.names:
+            if name not in _benchmarks:
+                parser.error("unknown benchmark: " + name)
+
+        results = {}
+        for name in (args.names or sorted(_benchmarks)):
+            results[name] = run_benchmark(name, args.number, args.repeat)
+            print('%-25s %12.2f us' % (name, results[name] * 1e6))
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump({
+                'tcl_version': str(teek.TCL_VERSION),
+                'python_version': sys.version,
+                'number': args.number,
+                'repeat': args.repeat,
+                'results': results,
+            }, file, indent=4)
+            file.write('\n')
+
+    if args.compare is not None:
+        with open(args.compare, 'r') as file:
+            old_results = json.load(file)['results']
+        print()
+        if compare(old_results, results, args.threshold / 100):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -34,9 +34,12 @@ from teek._structures import (
     Callback, Color, Image, ScreenDistance, TclVariable, StringVar, IntVar,
     FloatVar, BooleanVar, before_quit, after_quit)
 from teek._tcl_calls import (
-    tcl_call, tcl_eval, create_command, delete_command, run, quit, update,
-    init_threads, make_thread_safe)
+    tcl_call, tcl_eval, batch, create_command, delete_command, run, quit,
+    update, init_threads, make_thread_safe, call_soon_threadsafe, call_async,
+    use_command_dispatcher, capture_stack_traces)
 from teek._timeouts import after, after_idle
+from teek._async import async_run
+from teek._stats import enable_stats, disable_stats, stats
 from teek._widgets.base import Widget
 from teek._widgets.canvas import Canvas
 from teek._widgets.menu import Menu, MenuItem
@@ -0,0 +1,102 @@
+import asyncio
+import selectors
+import threading
+
+import teek
+from teek._tcl_calls import _get_interp
+
+# when asyncio has nothing to do, it waits in the select() method of a
+# selector, and this selector runs tk's event loop there instead
+
+
+class _TkSelector(selectors.DefaultSelector):
+
+    def __init__(self, interp):
+        super().__init__()
+        self._interp = interp       # set to None when quitting
+
+    def select(self, timeout=None):
+        if self._interp is None:
+            return super().select(timeout)
+
+        ready = super().select(0)
+        if ready or (timeout is not None and timeout <= 0):
+            # asyncio is busy, but the gui must not freeze
+            self._interp.handle_pending_events()
+            return ready or super().select(0)
+
+        # epoll and kqueue selectors have a file descriptor that becomes
+        # readable when the selector has something to do, and tk can wait
+        # for it together with gui events
+        if hasattr(self, 'fileno') and self._interp.can_watch_files():
+            self._interp.wait_for_event(self.fileno(), timeout)
+            return super().select(0)
+
+        # this is worse than the above, but it works on windows
+        self._interp.handle_pending_events()
+        if timeout is None or timeout > 0.01:
+            timeout = 0.01
+        return super().select(timeout)
+
+
+def _cancel_remaining_tasks(loop):
+    # asyncio.all_tasks() is new in python 3.7
+    try:
+        tasks = asyncio.all_tasks(loop)
+    except AttributeError:
+        tasks = asyncio.Task.all_tasks(loop)
+
+    tasks = [task for task in tasks if not task.done()]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(
+            asyncio.gather(*tasks, return_exceptions=True))
+
+
+def async_run(coro):
+    """Run an asyncio coroutine and teek's event loop at the same time.
+
+    This is like :func:`asyncio.run`, but teek's event loop runs while
+    the coroutine is running, so you can use asyncio and teek in the same
+    thread. The return value of the coroutine is returned.
+
+    If :func:`teek.quit` is called, the coroutine is cancelled and
+    ``async_run()`` returns ``None``. If the coroutine returns before that,
+    ``async_run()`` returns and the GUI stops responding, just like when
+    :func:`teek.run` returns.
+
+    There is more information and an example in :ref:`the asyncio docs
+    <asyncio>`.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        raise RuntimeError("async_run() must be called from main thread")
+
+    selector = _TkSelector(_get_interp())
+    loop = asyncio.SelectorEventLoop(selector)
+    quitted = False
+
+    def on_quit():
+        nonlocal quitted
+        quitted = True
+        selector._interp = None
+        main_task.cancel()
+
+    asyncio.set_event_loop(loop)
+    main_task = loop.create_task(coro)
+    teek.after_quit.connect(on_quit)
+    try:
+        return loop.run_until_complete(main_task)
+    except asyncio.CancelledError:
+        if quitted:
+            return None
+        raise
+    finally:
+        teek.after_quit.disconnect(on_quit)
+        try:
+            _cancel_remaining_tasks(loop)
+            if hasattr(loop, 'shutdown_asyncgens'):    # python 3.6+
+                loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
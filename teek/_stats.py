@@ -0,0 +1,179 @@
+import functools
+import threading
+
+# this is None when stats are not enabled, and otherwise it's like this:
+#
+#    {(category, key): {time_name: [total, max], ..., 'count': count}}
+#
+# _tcl_calls.py checks whether this is None before doing anything else with
+# stats, so that things aren't slowed down when stats are disabled
+records = None
+_lock = threading.Lock()
+
+# stats() returns these after disable_stats()
+_disabled_records = {}
+
+# these commands get a subcommand as the first argument, so 'wm title' and
+# 'wm withdraw' are counted separately, but 'puts hello' and 'puts world' are
+# not (also tk widget commands work like this, see call_key())
+_ENSEMBLES = {
+    'after', 'array', 'clipboard', 'dict', 'event', 'file', 'focus', 'font',
+    'grab', 'grid', 'image', 'info', 'namespace', 'option', 'pack', 'place',
+    'selection', 'string', 'tk', 'tkwait', 'trace', 'ttk::style', 'update',
+    'winfo', 'wm',
+}
+
+
+def call_key(tcl_args):
+    command = tcl_args[0]
+    if not isinstance(command, str):
+        return repr(command)
+    if command.startswith('.'):
+        command = 'pathName'
+    elif command.startswith('teek_command_') or command == 'teek_dispatch':
+        # 'teek_dispatch' is _DISPATCHER_NAME in _tcl_calls.py
+        return 'teek_command'
+    elif command not in _ENSEMBLES:
+        return command
+
+    if len(tcl_args) >= 2 and isinstance(tcl_args[1], str):
+        subcommand = tcl_args[1]
+        if subcommand.isidentifier():    # not e.g. a number or -option
+            return command + ' ' + subcommand
+    return command
+
+
+def function_key(func):
+    # bind() wraps functions, and it sets __wrapped__ like functools.wraps()
+    while True:
+        if isinstance(func, functools.partial):
+            func = func.func
+        elif getattr(func, '__wrapped__', None) is not None:
+            func = func.__wrapped__
+        else:
+            break
+
+    try:
+        return func.__module__ + '.' + func.__qualname__
+    except (AttributeError, TypeError):
+        return type(func).__name__
+
+
+def record(category, key, **times):
+    with _lock:
+        if records is None:
+            # stats were disabled while the thing was timed
+            return
+
+        try:
+            times_and_count = records[category, key]
+        except KeyError:
+            times_and_count = {name: [0, 0] for name in times}
+            times_and_count['count'] = 0
+            records[category, key] = times_and_count
+
+        times_and_count['count'] += 1
+        for name, seconds in times.items():
+            total_and_max = times_and_count[name]
+            total_and_max[0] += seconds
+            if seconds > total_and_max[1]:
+                total_and_max[1] = seconds
+
+
+def enable_stats():
+    """Start recording how long Tcl calls take.
+
+    This also forgets everything that was recorded earlier, so you can call
+    ``enable_stats()`` again to start over. Recording is off by default
+    because it slows things down a bit.
+    """
+    global records, _disabled_records
+    with _lock:
+        records = {}
+        _disabled_records = {}
+
+
+def disable_stats():
+    """Stop recording stats.
+
+    :func:`stats` returns what was recorded before this was called.
+    """
+    global records, _disabled_records
+    with _lock:
+        if records is not None:
+            _disabled_records = records
+        records = None
+
+
+def _records_to_dict(records):
+    result = {'tcl_calls': {}, 'commands': {}, 'thread_calls': {}}
+    for (category, key), times_and_count in records.items():
+        result[category][key] = {
+            name: (value if name == 'count' else
+                   {'total': value[0], 'max': value[1]})
+            for name, value in times_and_count.items()
+        }
+    return result
+
+
+def stats():
+    """Return what has been recorded since :func:`enable_stats` was called.
+
+    The return value is a dict that contains only dicts, strings and numbers,
+    so it can be saved with :func:`json.dump`. It looks like this, except
+    that there are usually many more keys::
+
+        {
+            'tcl_calls': {
+                'pathName configure': {
+                    'count': 3,
+                    'python_time': {'total': 0.0001, 'max': 0.00005},
+                    'tcl_time': {'total': 0.002, 'max': 0.0015},
+                },
+                ...
+            },
+            'commands': {
+                'mymodule.on_click': {
+                    'count': 1,
+                    'time': {'total': 0.001, 'max': 0.001},
+                },
+                ...
+            },
+            'thread_calls': {
+                'wait': {
+                    'count': 20,
+                    'time': {'total': 0.5, 'max': 0.05},
+                },
+            },
+        }
+
+    All times are in seconds.
+
+    ``'tcl_calls'`` contains :func:`.tcl_call` and :func:`.tcl_eval` calls,
+    including the calls that teek does. The keys are Tcl command names, and
+    subcommands are included for widget commands (``pathName`` means any
+    widget) and commands like ``wm``. All commands created with
+    :func:`.create_command` are counted as ``'teek_command'``, all
+    :func:`.tcl_eval` calls are counted as ``'tcl_eval'``, and Tcl calls done
+    by :func:`.batch` are counted as ``'teek.batch()'``. The ``python_time``
+    is spent converting the arguments to Tcl and the return value to Python,
+    and the ``tcl_time`` is spent in Tcl. If the Tcl call is done from a
+    thread, the ``tcl_time`` also includes waiting for the event loop.
+
+    ``'commands'`` contains calls of Python functions from Tcl (e.g. button
+    click callbacks) by the module and name of the function. For things like
+    button commands, bindings and :func:`.after` callbacks, that's the
+    function that you gave to teek, and if there are many functions
+    connected to the same :class:`.Callback`, they are all in the key, e.g.
+    ``'mymodule.on_click, mymodule.log_click'``. The time includes
+    converting the arguments and the return value, and any Tcl calls that
+    the function does.
+
+    ``'thread_calls'`` contains the time that the event loop was busy doing
+    something else after :ref:`a thread <threads>` wanted it to do
+    something.
+    """
+    with _lock:
+        if records is None:
+            return _records_to_dict(_disabled_records)
+        return _records_to_dict(records)
@@ -4,12 +4,15 @@ import collections.abc
 import functools
 import itertools
 import os
+import re
 import sys
 import tempfile
 import traceback
 
 import teek
-from teek._tcl_calls import make_thread_safe
+from teek import _stats
+from teek._tcl_calls import (
+    from_tcl, make_thread_safe, _capture_stack, _make_batchable)
 
 
 def _is_from_teek(traceback_frame_summary):
@@ -61,17 +64,10 @@ class Callback:
            :meth:`.run` knows that one of the callbacks returned ``'break'``.
            This is used in :ref:`bindings <binding-break>`.
         """
-        stack = traceback.extract_stack()
-
-        # skip some teek implementation details, they are too verbose
-        while stack and _is_from_teek(stack[-1]):
-            del stack[-1]
-
-        stack_info = ''.join(traceback.format_list(stack))
-
+        stack = _capture_stack(sys._getframe())
         if kwargs is None:
             kwargs = {}
-        self._connections.append((function, args, kwargs, stack_info))
+        self._connections.append((function, args, kwargs, stack))
 
     def disconnect(self, function):
         """Undo a :meth:`~connect` call.
@@ -108,6 +104,13 @@ class Callback:
 
         raise ValueError("not connected: %r" % (function,))
 
+    # teek.stats() shows calls of the connected functions with this when the
+    # callback runs from tcl, see create_command()
+    def _stats_key(self):
+        keys = [_stats.function_key(func)
+                for func, args, kwargs, stack in self._connections]
+        return ', '.join(keys) or 'teek.Callback'
+
     def run(self, *args):
         """Run the connected callbacks.
 
@@ -116,7 +119,9 @@ class Callback:
         ``'break'``, this returns ``None``. If a callback raises an exception,
         a traceback is printed and ``None`` is returned.
         """
-        for func, extra_args, kwargs, stack_info in self._connections:
+        # a copy of the list is needed because callbacks may disconnect
+        # themselves when they run
+        for func, extra_args, kwargs, stack in self._connections.copy():
             try:
                 result = func(*(args + tuple(extra_args)), **kwargs)
                 if result == 'break':
@@ -130,6 +135,12 @@ class Callback:
                 # with pythonw.exe, and print('blah', file=None) does nothing
                 # but None.write('blah\n') is an error
                 traceback_blabla, rest = traceback.format_exc().split('\n', 1)
+                if stack is None:
+                    stack_info = ''
+                else:
+                    # skip some teek implementation details, they are too
+                    # verbose
+                    stack_info = stack.format(skip_last=_is_from_teek)
                 print(traceback_blabla, file=sys.stderr)
                 print(stack_info + rest, end='', file=sys.stderr)
                 return None
@@ -182,6 +193,23 @@ class ConfigDict(collections.abc.MutableMapping):
     def _list_options(self):
         """Returns an iterable of options that can be passed to _get."""
 
+    def _set_many(self, options):
+        """Sets options from a dict like _set does.
+
+        Override this if all options can be set at once.
+        """
+        for option, value in options.items():
+            self._set(option, value)
+
+    def _get_all(self):
+        """Returns a dict of options and their values like _get does.
+
+        Override this if all values can be gotten at once. The values of
+        options in self._special don't matter because they are replaced.
+        """
+        return {option: self._get(option) for option in self._list_options()
+                if option not in self._special}
+
     def _check_option(self, option):
         # by default, e.g. -tex would be equivalent to -text, but that's
         # disabled to make lookups in self._types and self._disabled
@@ -191,8 +219,7 @@ class ConfigDict(collections.abc.MutableMapping):
 
     # the type of value is not checked with self._types because python is
     # dynamically typed
-    @make_thread_safe
-    def __setitem__(self, option, value):
+    def _check_settable(self, option):
         self._check_option(option)
         if option in self._special:
             message = "cannot set the value of %r" % option
@@ -202,8 +229,20 @@ class ConfigDict(collections.abc.MutableMapping):
                 )
             raise ValueError(message)
 
+    @_make_batchable
+    def __setitem__(self, option, value):
+        self._check_settable(option)
         self._set(option, value)
 
+    @_make_batchable
+    def update(self, *args, **kwargs):
+        # MutableMapping.update() would set the options one by one
+        options = dict(*args, **kwargs)
+        for option in options:
+            self._check_settable(option)
+        if options:
+            self._set_many(options)
+
     @make_thread_safe
     def __getitem__(self, option):
         self._check_option(option)
@@ -231,23 +270,118 @@ class ConfigDict(collections.abc.MutableMapping):
         except TypeError:   # why can't len() consume iterators like 'in' :((
             return len(list(options))
 
+    @make_thread_safe
+    def snapshot(self):
+        """Return the options and their values as a new dict.
+
+        This returns the same thing as ``dict(config)``, but it gets all
+        values with one Tcl call instead of doing one call for each option.
+        """
+        values = self._get_all()
+        return {option: (self[option] if option in self._special
+                         else values[option])
+                for option in self._list_options()}
+
+
+# {options_key: OrderedDict({option: None})}, see CgetConfigureConfigDict
+# the values keep the order that tk uses, and 'in' is fast with them
+_options_cache = {}
+after_quit.connect(_options_cache.clear)
+
 
 class CgetConfigureConfigDict(ConfigDict):
 
-    def __init__(self, caller_func):
+    # options_key should be something hashable that is same for all config
+    # dicts that have the same options, e.g. a widget's _widget_name, or
+    # None to get the options from tcl every time
+    def __init__(self, caller_func, options_key=None):
         super().__init__()
         self._caller_func = caller_func
+        self._options_key = options_key
 
     def _set(self, option, value):
         self._caller_func(None, 'configure', '-' + option, value)
 
+    def _set_many(self, options):
+        args = []
+        for option, value in options.items():
+            args.extend(['-' + option, value])
+        self._caller_func(None, 'configure', *args)
+
     def _get(self, option):
         return self._caller_func(self._types.get(option, str),
                                  'cget', '-' + option)
 
     def _list_options(self):
+        if self._options_key is None:
+            infos = self._caller_func([[str]], 'configure')
+            return (info[0].lstrip('-') for info in infos)
+
+        try:
+            return _options_cache[self._options_key]
+        except KeyError:
+            infos = self._caller_func([[str]], 'configure')
+            options = collections.OrderedDict.fromkeys(
+                info[0].lstrip('-') for info in infos)
+            _options_cache[self._options_key] = options
+            return options
+
+    def _get_all(self):
+        # each info is {-option dbName dbClass default value}, or
+        # {-option -other_option} for synonyms like -bd and -borderwidth
         infos = self._caller_func([[str]], 'configure')
-        return (info[0].lstrip('-') for info in infos)
+        strings = {info[0].lstrip('-'): info[-1] for info in infos
+                   if len(info) != 2}
+        result = {}
+        for info in infos:
+            option = info[0].lstrip('-')
+            if len(info) == 2:
+                string = strings[info[1].lstrip('-')]
+            else:
+                string = strings[option]
+            result[option] = from_tcl(self._types.get(option, str), string)
+        return result
+
+
+# tk's #rgb colors are not parsed in python because tk on x11 uses the
+# digits as the most significant bits of the value (#fff is 240, 240, 240),
+# but tk on other platforms repeats the digits (#fff is 255, 255, 255)
+_HEX_COLOR_REGEX = re.compile(
+    r'#([0-9A-Fa-f]{6}|[0-9A-Fa-f]{9}|[0-9A-Fa-f]{12})')
+
+# {color_string: (red, green, blue)}, for color names and other things that
+# tk must parse
+_colors = {}
+_MAX_COLORS = 1024
+after_quit.connect(_colors.clear)
+
+
+def _parse_color(color_string):
+    match = _HEX_COLOR_REGEX.fullmatch(color_string)
+    if match is not None:
+        # the first 2 digits of each component are the 8 most significant
+        # bits, and the rest are ignored like below
+        digits = match.group(1)
+        step = len(digits) // 3
+        return tuple(int(digits[start:start + 2], 16)
+                     for start in range(0, len(digits), step))
+
+    try:
+        return _colors[color_string]
+    except KeyError:
+        # any widget will do, i'm using the '.' root window because it
+        # always exists
+        rgb = teek.tcl_call([int], 'winfo', 'rgb', '.', color_string)
+
+        # tk uses 16-bit colors for some reason, but most people are more
+        # familiar with 8-bit colors so we'll shift away the "useless" bits
+        result = tuple(value >> 8 for value in rgb)
+        assert len(result) == 3
+
+        if len(_colors) >= _MAX_COLORS:
+            _colors.clear()
+        _colors[color_string] = result
+        return result
 
 
 class Color:
@@ -274,7 +408,9 @@ class Color:
 
     The string argument things are implemented by letting Tk interpret the
     color, so all of the ways to define colors as strings shown in
-    :man:`Tk_GetColor(3tk)` are supported.
+    :man:`Tk_GetColor(3tk)` are supported. Tk is not needed for RGB values or
+    hexadecimal strings like ``'#ff0000'``, and the result of interpreting
+    other strings is remembered, so creating many color objects is fast.
 
     Color objects are hashable, and they can be compared with ``==``::
 
@@ -308,22 +444,15 @@ class Color:
                 if value not in range(256):
                     raise ValueError("invalid %s value: %r" % (name, value))
             self._color_string = '#%02x%02x%02x' % args
+            self._rgb = args
         elif len(args) == 1:
             self._color_string = args[0]
+            self._rgb = _parse_color(self._color_string)
         else:
             # python raises TypeError for wrong number of arguments
             raise TypeError("use {0}(red, green, blue) or {0}(color_string)"
                             .format(type(self).__name__))
 
-        # any widget will do, i'm using the '.' root window because it
-        # always exists
-        rgb = teek.tcl_call([int], 'winfo', 'rgb', '.', self._color_string)
-
-        # tk uses 16-bit colors for some reason, but most people are more
-        # familiar with 8-bit colors so we'll shift away the "useless" bits
-        self._rgb = tuple(value >> 8 for value in rgb)
-        assert len(self._rgb) == 3
-
     def __repr__(self):
         return '<%s %r: red=%d, green=%d, blue=%d>' % (
             type(self).__name__, self._color_string,
@@ -474,7 +603,9 @@ class TclVariable:
             def runner(*junk):
                 self._write_trace.run(self)
 
-            command = teek.create_command(runner, [str, str, str])
+            command = teek.create_command(
+                runner, [str, str, str],
+                stats_key=self._write_trace._stats_key)
             teek.tcl_call(None, 'trace', 'add', 'variable',
                           self, 'write', command)
 
@@ -487,6 +618,66 @@ class FloatVar(TclVariable): type_spec = float      # noqa: E302
 class BooleanVar(TclVariable): type_spec = bool     # noqa: E302
 
 
+# screen distances without units are pixels, and they don't need tcl
+_PIXELS_REGEX = re.compile(r'^[-+]?(\d+\.?\d*|\.\d+)$')
+_MAX_INT = 2**31 - 1
+
+# {value_string: (pixels, fpixels)} for screen distances with units, like
+# '2c', this is cleared when 'tk scaling' changes how big the units are
+_screen_distances = {}
+_MAX_SCREEN_DISTANCES = 1024
+_tracing_scaling = False
+
+
+def _reset_screen_distances():
+    global _tracing_scaling
+    _screen_distances.clear()
+    _tracing_scaling = False
+
+
+after_quit.connect(_reset_screen_distances)
+
+
+def _on_tk_command(command_string, *junk):
+    # 'tk scaling' without more arguments doesn't change the scaling, but
+    # forgetting the screen distances doesn't break anything
+    if from_tcl([str], command_string)[1:2] == ['scaling']:
+        _screen_distances.clear()
+
+
+def _get_pixels(value_string):
+    if _PIXELS_REGEX.match(value_string) is not None:
+        fpixels = float(value_string)
+        # this rounds like tk does
+        if fpixels < 0:
+            pixels = int(fpixels - 0.5)
+        else:
+            pixels = int(fpixels + 0.5)
+        if abs(pixels) <= _MAX_INT:
+            return (pixels, fpixels)
+        # let tk complain about it
+
+    try:
+        return _screen_distances[value_string]
+    except KeyError:
+        pass
+
+    global _tracing_scaling
+    if not _tracing_scaling:
+        command = teek.create_command(_on_tk_command, extra_args_type=str)
+        teek.tcl_call(None, 'trace', 'add', 'execution', 'tk', 'leave',
+                      command)
+        _tracing_scaling = True
+
+    # these fail if the screen distance is invalid
+    result = (teek.tcl_call(int, 'winfo', 'pixels', '.', value_string),
+              teek.tcl_call(float, 'winfo', 'fpixels', '.', value_string))
+    if len(_screen_distances) >= _MAX_SCREEN_DISTANCES:
+        _screen_distances.clear()
+    _screen_distances[value_string] = result
+    return result
+
+
 @functools.total_ordering
 class ScreenDistance:
     """Represents a Tk screen distance.
@@ -519,6 +710,10 @@ class ScreenDistance:
 
         This is implemented with ``winfo fpixels``, documented in
         :man:`winfo(3tk)`.
+
+    Tk is not needed for values that are already pixels, like ``123`` or
+    ``'12.5'``. The pixels of values with units, like ``'2c'``, are
+    remembered until ``tk scaling`` is used to change how big the units are.
     """
 
     def __init__(self, value):
@@ -526,9 +721,7 @@ class ScreenDistance:
 
         # creating a ScreenDistance object must fail if the screen distance
         # is invalid, that's why this is here
-        self.pixels = teek.tcl_call(int, 'winfo', 'pixels', '.', self._value)
-        self.fpixels = teek.tcl_call(float, 'winfo', 'fpixels', '.',
-                                     self._value)
+        self.pixels, self.fpixels = _get_pixels(self._value)
 
     def __repr__(self):
         return '%s(%r)' % (type(self).__name__, self._value)
@@ -621,7 +814,8 @@ class Image:
     def _init_from_name(self, name):
         self._name = name
         self.config = CgetConfigureConfigDict(
-            lambda returntype, *args: teek.tcl_call(returntype, self, *args))
+            lambda returntype, *args: teek.tcl_call(returntype, self, *args),
+            ('image', 'photo'))
         self.config._types.update({
             'data': str,
             'format': str,
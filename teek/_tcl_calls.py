@@ -1,14 +1,20 @@
 import collections
+import concurrent.futures
+import contextlib
 import functools
 import itertools
+import math
 import numbers
 import queue
+import socket
 import sys
 import threading
+import time
 import traceback
 import _tkinter
 
 import teek
+from teek import _stats
 
 _flatten = itertools.chain.from_iterable
 
@@ -34,32 +40,55 @@ def _convert_errors(func):
 counts = collections.defaultdict(lambda: itertools.count(1))
 
 
-# because readability is good
-# TODO: is there something like this in e.g. concurrent.futures?
-class _Future:
+def _record_queue_wait(func):
+    enqueued = time.perf_counter()
 
-    def __init__(self):
-        self._value = None
-        self._error = None
-        self._event = threading.Event()
-        self._success = None
+    def func_with_stats(*args, **kwargs):
+        _stats.record('thread_calls', 'wait',
+                      time=(time.perf_counter() - enqueued))
+        return func(*args, **kwargs)
+
+    return func_with_stats
+
+
+def _print_traceback():
+    # this doesn't use traceback.print_exc() because sys.stderr is None with
+    # pythonw.exe, see Callback.run()
+    print(traceback.format_exc(), end='', file=sys.stderr)
+
+
+# see capture_stack_traces()
+_capturing_stacks = True
 
-    def set_value(self, value):
-        self._value = value
-        self._success = True
-        self._event.set()
 
-    def set_error(self, exc):
-        self._error = exc
-        self._success = False
-        self._event.set()
+# create_command() and Callback.connect() remember where they were called, so
+# that the error messages can show it, but formatting the stack right away
+# would be slow and the formatted stack is rarely needed
+class _LazyStack:
 
-    def get_value(self):
-        self._event.wait()
-        assert self._success is not None
-        if not self._success:
-            raise self._error
-        return self._value
+    def __init__(self, frame):
+        # frame objects would keep local variables alive, codes don't
+        self._codes_and_linenos = []
+        while frame is not None:
+            self._codes_and_linenos.append((frame.f_code, frame.f_lineno))
+            frame = frame.f_back
+        self._codes_and_linenos.reverse()
+
+    def format(self, skip_last=None):
+        summaries = [
+            traceback.FrameSummary(code.co_filename, lineno, code.co_name)
+            for code, lineno in self._codes_and_linenos]
+        if skip_last is not None:
+            while summaries and skip_last(summaries[-1]):
+                del summaries[-1]
+        return ''.join(traceback.format_list(summaries))
+
+
+# the frame is usually sys._getframe(), returns None if stacks are not captured
+def _capture_stack(frame):
+    if _capturing_stacks:
+        return _LazyStack(frame)
+    return None
 
 
 class _TclInterpreter:
@@ -73,6 +102,12 @@ class _TclInterpreter:
 
         self._init_threads_called = False
 
+        # see _init_wakeup_socket()
+        self._wakeup_socket = None
+
+        # see create_dispatched_command(), this is {id: func} or None
+        self._dispatch_table = None
+
         # tkinter does this :D i have no idea what each argument means
         self._app = _tkinter.create(None, sys.argv[0], 'Tk', 1, 1, 1, 0, None)
 
@@ -102,6 +137,35 @@ class _TclInterpreter:
         if self._init_threads_called:
             raise RuntimeError("init_threads() was called twice")
 
+        if poll_interval_ms is None:
+            self._init_wakeup_socket()
+        else:
+            self._init_queue_poller(poll_interval_ms)
+        self._init_threads_called = True
+
+    def _run_queued_calls(self):
+        while True:
+            try:
+                item = self._call_queue.get(block=False)
+            except queue.Empty:
+                break
+
+            func, args, kwargs, future = item
+            if future is None:
+                # call_soon_threadsafe(), nobody is waiting for the result
+                try:
+                    func(*args, **kwargs)
+                except Exception:
+                    _print_traceback()
+            elif future.set_running_or_notify_cancel():
+                try:
+                    value = func(*args, **kwargs)
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(value)
+
+    def _init_queue_poller(self, poll_interval_ms):
         # hard-coded name is ok because there is only one of these in each
         # Tcl interpreter
         poller_tcl_command = 'teek_init_threads_queue_poller'
@@ -111,21 +175,7 @@ class _TclInterpreter:
         @_convert_errors
         def poller():
             nonlocal after_id
-
-            while True:
-                try:
-                    item = self._call_queue.get(block=False)
-                except queue.Empty:
-                    break
-
-                func, args, kwargs, future = item
-                try:
-                    value = func(*args, **kwargs)
-                except Exception as e:
-                    future.set_error(e)
-                else:
-                    future.set_value(value)
-
+            self._run_queued_calls()
             after_id = self._app.call(
                 'after', poll_interval_ms, 'teek_init_threads_queue_poller')
 
@@ -138,27 +188,113 @@ class _TclInterpreter:
         teek.before_quit.connect(quit_disconnecter)
 
         poller()
-        self._init_threads_called = True
+
+    # this is like the poller, but other threads wake up the event loop by
+    # writing to a socket, so nothing runs when nothing has been queued
+    def _init_wakeup_socket(self):
+        if not self.can_watch_files():
+            raise RuntimeError(
+                "init_threads(poll_interval_ms=None) is not supported on "
+                "this platform")
+
+        # asyncio uses a socketpair for this too, it's less error-prone
+        # than os.pipe() because sending to a closed socket object can't
+        # accidentally write to some other file that reused the fd
+        read_socket, write_socket = socket.socketpair()
+        read_socket.setblocking(False)
+        write_socket.setblocking(False)
+
+        @_convert_errors
+        def on_readable(file, mask):
+            # many wakeups may have been sent since the previous time, but
+            # one _run_queued_calls() handles everything that was queued
+            try:
+                while read_socket.recv(4096):
+                    pass
+            except BlockingIOError:
+                pass
+            self._run_queued_calls()
+
+        self._app.createfilehandler(
+            read_socket, _tkinter.READABLE, on_readable)
+        self._wakeup_socket = write_socket
+
+        def quit_disconnecter():
+            # otherwise this would also run when an interpreter created after
+            # this one quits
+            teek.before_quit.disconnect(quit_disconnecter)
+
+            self._wakeup_socket = None
+            self._app.deletefilehandler(read_socket)
+            read_socket.close()
+            write_socket.close()
+
+        teek.before_quit.connect(quit_disconnecter)
 
     # no, don't do kwargs=None and then check for Noneness and kwargs={} etc
     # that made my test code run about 5% slower, because this is called a lot
     def call_thread_safely(self, non_threadsafe_func, args=(), kwargs={}, *,
                            convert_errors=True):
         try:
+            # calls collected with teek.batch() must be done before this, and
+            # they are in the batch of the calling thread, so this must be
+            # done before going to the event loop
+            _flush_batch()
+
             if threading.get_ident() == self._main_thread_ident:
                 return non_threadsafe_func(*args, **kwargs)
 
-            if not self._init_threads_called:
-                raise RuntimeError("init_threads() wasn't called")
-
-            future = _Future()
-            self._call_queue.put((non_threadsafe_func, args, kwargs, future))
-            return future.get_value()
+            future = concurrent.futures.Future()
+            self._enqueue(non_threadsafe_func, args, kwargs, future)
+            return future.result()
         except _tkinter.TclError as e:
             if convert_errors:
                 _raise_converted_error(e)
             raise e
 
+    # future can be None for not getting the result at all
+    def _enqueue(self, func, args, kwargs, future):
+        if not self._init_threads_called:
+            raise RuntimeError("init_threads() wasn't called")
+
+        if _stats.records is not None:
+            func = _record_queue_wait(func)
+        self._call_queue.put((func, args, kwargs, future))
+        self._wake_up()
+
+    def call_soon_threadsafe(self, func, args, kwargs):
+        _flush_batch()      # see call_thread_safely()
+        if threading.get_ident() == self._main_thread_ident:
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                _print_traceback()
+        else:
+            self._enqueue(func, args, kwargs, None)
+
+    def call_async(self, func, args, kwargs):
+        _flush_batch()      # see call_thread_safely()
+        future = concurrent.futures.Future()
+        if threading.get_ident() == self._main_thread_ident:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            self._enqueue(func, args, kwargs, future)
+        return future
+
+    def _wake_up(self):
+        wakeup_socket = self._wakeup_socket     # quitting may set it to None
+        if wakeup_socket is not None:
+            try:
+                wakeup_socket.send(b'\0')
+            except OSError:
+                # BlockingIOError means that lots of wakeups are pending
+                # already, and other errors mean that we are quitting
+                pass
+
     # self._app must be accessed from the main thread, and this class provides
     # methods for calling it thread-safely
 
@@ -170,6 +306,34 @@ class _TclInterpreter:
         # no idea what the 0 does, tkinter calls it like this
         self._app.mainloop(0)
 
+    # these are for async_run(), see _async.py
+    def handle_pending_events(self):
+        while self._app.dooneevent(_tkinter.DONT_WAIT):
+            pass
+
+    def can_watch_files(self):
+        # createfilehandler doesn't exist on windows
+        return hasattr(self._app, 'createfilehandler')
+
+    # handles one event, but also returns if the file becomes readable or if
+    # timeout seconds have passed, timeout can be None for waiting forever
+    def wait_for_event(self, fileno, timeout):
+        if timeout is None:
+            after_id = None
+        else:
+            # the rounding up avoids busy-waiting with after 0
+            after_id = self._app.call(
+                'after', math.ceil(timeout * 1000), '')
+
+        self._app.createfilehandler(
+            fileno, _tkinter.READABLE, lambda file, mask: None)
+        try:
+            self._app.dooneevent(0)
+        finally:
+            self._app.deletefilehandler(fileno)
+            if after_id is not None:
+                self._app.call('after', 'cancel', after_id)
+
     def getboolean(self, arg):
         return self.call_thread_safely(self._app.getboolean, [arg])
 
@@ -195,6 +359,14 @@ class _TclInterpreter:
     def call(self, *args):
         return self.call_thread_safely(self._app.call, args)
 
+    def _call_many(self, calls):
+        for args in calls:
+            self._app.call(args)
+
+    # this is one item in the queue, no matter how many calls there are
+    def call_many(self, calls):
+        return self.call_thread_safely(self._call_many, [calls])
+
     def eval(self, code):
         return self.call_thread_safely(self._app.eval, [code])
 
@@ -204,10 +376,44 @@ class _TclInterpreter:
     def deletecommand(self, name):
         return self.call_thread_safely(self._app.deletecommand, [name])
 
+    # instead of creating a tcl command for each function, this stores the
+    # function to a dict, and one tcl command looks up functions from there
+    #
+    # these must be called from the main thread, like create_command() and
+    # delete_command() do
+    def create_dispatched_command(self, func):
+        if self._dispatch_table is None:
+            self._dispatch_table = {}
+            self._app.createcommand(_DISPATCHER_NAME, self._dispatch)
+
+        command_id = next(counts['commands'])
+        self._dispatch_table[command_id] = func
+        return '%s %d' % (_DISPATCHER_NAME, command_id)
+
+    def delete_dispatched_command(self, command):
+        junk, command_id = command.split()
+        if self._dispatch_table is None or (
+                self._dispatch_table.pop(int(command_id), None) is None):
+            raise teek.TclError('invalid command name "%s"' % command)
+
+    def _dispatch(self, command_id, *args):
+        try:
+            func = self._dispatch_table[int(command_id)]
+        except (KeyError, ValueError):
+            # raising an error here would make _tkinter raise it from run()
+            print('teek: invalid command name "%s %s"'
+                  % (_DISPATCHER_NAME, command_id), file=sys.stderr)
+            return ''
+        return func(*args)
+
 
 # a global _TclInterpreter instance
 _interp = None
 
+# see use_command_dispatcher()
+_DISPATCHER_NAME = 'teek_dispatch'
+_dispatcher_enabled = False
+
 
 # these are the only functions that access _interp directly
 def _get_interp():
@@ -248,7 +454,8 @@ def quit():
 
         # to avoid a weird errors, see test_weird_error in test_tcl_calls.py
         for command in teek.tcl_call([str], 'info', 'commands'):
-            if command.startswith('teek_command_'):
+            if (command.startswith('teek_command_') or
+                    command == _DISPATCHER_NAME):
                 delete_command(command)
 
         _interp = None
@@ -279,8 +486,15 @@ def init_threads(poll_interval_ms=50):
 
     When a Tcl call is done from another thread, that thread blocks until the
     after callback has handled it, which is slow. If this is a problem, there
-    are two things you can do:
-
+    are a few things you can do:
+
+    * Use ``poll_interval_ms=None``. Then there is no after callback at all;
+      instead, the other thread wakes up the event loop right away by writing
+      a byte to a socket that the event loop is watching. Tcl calls from
+      threads don't need to wait for the next poll, and your program doesn't
+      wake up 20 times per second when it is doing nothing. This doesn't work
+      on Windows, because Tk can't watch sockets or files on Windows; you get
+      :exc:`RuntimeError` if you try it there.
     * Use a smaller ``poll_interval_ms``. Watch your CPU usage though; if you
       make ``poll_interval_ms`` too small, you might get 100% CPU usage when
       your program is doing nothing.
@@ -289,6 +503,43 @@ def init_threads(poll_interval_ms=50):
     _get_interp().init_threads(poll_interval_ms)
 
 
+def call_soon_threadsafe(func, args=(), kwargs=None):
+    """Run ``func(*args, **kwargs)`` in the event loop without waiting for it.
+
+    This is like :func:`make_thread_safe`, but the calling thread doesn't
+    wait until the function has ran, so a thread can e.g. insert lots of text
+    to a :class:`.Text` widget without waiting for the GUI after each insert.
+    If you need the return value, use :func:`call_async` instead. If the
+    function raises an exception, the traceback is printed, just like when a
+    callback connected to a :class:`.Callback` raises an error.
+
+    The functions run in the same order as they were passed to
+    ``call_soon_threadsafe()``, together with functions decorated with
+    :func:`make_thread_safe` and other teek things called from other threads.
+
+    If this is called from the main thread, the function runs right away.
+    Otherwise :func:`init_threads` must be called first.
+    """
+    if kwargs is None:
+        kwargs = {}
+    _get_interp().call_soon_threadsafe(func, args, kwargs)
+
+
+def call_async(func, args=(), kwargs=None):
+    """Like :func:`call_soon_threadsafe`, but returns a future object.
+
+    The return value is a :class:`concurrent.futures.Future`. Its
+    ``result()`` method waits until the function has ran in the event loop,
+    and then returns what it returned or raises the error it raised.
+
+    If this is called from the main thread, the function runs right away and
+    the returned future is already done.
+    """
+    if kwargs is None:
+        kwargs = {}
+    return _get_interp().call_async(func, args, kwargs)
+
+
 def make_thread_safe(func):
     """A decorator that makes a function safe to be called from any thread.
 
@@ -340,106 +591,366 @@ def make_thread_safe(func):
     return safe
 
 
-def to_tcl(value):
-    # these are ordered so that performance is good
-    # please profile when changing order
-    if isinstance(value, str):
-        return value
-    if value is None:
-        return ''
-    if isinstance(value, bool):
-        return '1' if value else '0'
+# like make_thread_safe(), but if the calling thread is inside teek.batch(),
+# the function runs in the calling thread, so that its Tcl calls end up in
+# the batch of that thread instead of costing a trip to the event loop
+#
+# use this only for functions that do nothing but Tcl calls (tcl_call() is
+# thread safe) and checks that don't change anything, e.g. setting options
+def _make_batchable(func):
+    safe = make_thread_safe(func)
 
-    try:
-        to_tcl_method = value.to_tcl
-    except AttributeError:
-        pass
-    else:
-        return to_tcl_method()
+    @functools.wraps(func)
+    def batchable(*args, **kwargs):
+        if _batch_state.current is None:
+            return safe(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    return batchable
+
+
+# classes like Text.TextIndex are created again for each widget, and they
+# have a _teek_converters dict in their __dict__; converters for them are
+# cached there instead of the module-level dicts below, because the
+# module-level dicts would keep destroyed widgets alive
+def _find_class_cache(spec_key):
+    if isinstance(spec_key, (tuple, frozenset)):
+        for item in spec_key:
+            cache = _find_class_cache(item)
+            if cache is not None:
+                return cache
+        return None
+    if isinstance(spec_key, type):
+        return spec_key.__dict__.get('_teek_converters')
+    return None
+
+
+# to_tcl() is called for every argument of every tcl call, so it looks up a
+# converter function by the type of the value instead of doing lots of
+# isinstance checks every time
+#
+# this is cleared when it gets too big, just in case
+_to_tcl_converters = {}
+_MAX_TO_TCL_CONVERTERS = 256
+
+
+def _return_as_is(value):
+    return value
+
+
+def _none_to_tcl(value):
+    return ''
 
-    if isinstance(value, numbers.Real):    # after bool check, bools are ints
-        return str(value)
-    if isinstance(value, collections.abc.Mapping):
-        return tuple(map(to_tcl, _flatten(value.items())))
 
-    # assume it's some kind of iterable, this must be after the Mapping
-    # and str stuff above
+def _bool_to_tcl(value):
+    return '1' if value else '0'
+
+
+def _method_to_tcl(value):
+    return value.to_tcl()
+
+
+def _mapping_to_tcl(value):
+    return tuple(map(to_tcl, _flatten(value.items())))
+
+
+def _iterable_to_tcl(value):
+    if not isinstance(value, (list, tuple)):
+        value = list(value)
+
+    # canvas coordinates and such can be long lists of numbers, and this is
+    # much faster for them than calling to_tcl() for each number
+    if set(map(type, value)) <= {int, float}:
+        return tuple(map(str, value))
     return tuple(map(to_tcl, value))
 
 
+def _find_to_tcl_converter(value_type):
+    # these are ordered like the isinstance checks used to be, because e.g.
+    # bool is a subclass of int and Mapping things are iterable
+    if issubclass(value_type, str):
+        return _return_as_is
+    if value_type is type(None):
+        return _none_to_tcl
+    if issubclass(value_type, bool):
+        return _bool_to_tcl
+    if hasattr(value_type, 'to_tcl'):
+        return _method_to_tcl
+    if issubclass(value_type, numbers.Real):
+        return str
+    if issubclass(value_type, collections.abc.Mapping):
+        return _mapping_to_tcl
+
+    # assume it's some kind of iterable
+    return _iterable_to_tcl
+
+
+def to_tcl(value):
+    value_type = type(value)
+    converter = _to_tcl_converters.get(value_type)
+    if converter is None:
+        cache = _find_class_cache(value_type)
+        if cache is None:
+            converter = _find_to_tcl_converter(value_type)
+            if len(_to_tcl_converters) >= _MAX_TO_TCL_CONVERTERS:
+                _to_tcl_converters.clear()
+            _to_tcl_converters[value_type] = converter
+        else:
+            # to_tcl is not a type spec, so it can be used as a key here
+            converter = cache.get(to_tcl)
+            if converter is None:
+                converter = _find_to_tcl_converter(value_type)
+                cache[to_tcl] = converter
+    return converter(value)
+
+
 def _pairs(sequence):
     assert len(sequence) % 2 == 0, "cannot divide %r into pairs" % (sequence,)
     return zip(sequence[0::2], sequence[1::2])
 
 
-def from_tcl(type_spec, value):
-    if type_spec is None:
+# from_tcl() is called a lot, so type specs are compiled into converter
+# functions, and the converters are cached here
+#
+# the keys are the type specs, but lists, tuples and dicts are converted to
+# hashable tuples with _spec_key(), e.g. [int] -> (list, int)
+#
+# this isn't keyed by id(type_spec) because type specs like [int] are often
+# created again for each call, and ids of garbage collected objects get
+# reused; type specs that contain classes like Text.TextIndex are cached in
+# the classes, see _find_class_cache(), and this is cleared when it gets too
+# big just in case
+_converters = {}
+_MAX_CONVERTERS = 256
+
+
+def _spec_key(type_spec):
+    if isinstance(type_spec, list):
+        return (list,) + tuple(map(_spec_key, type_spec))
+    if isinstance(type_spec, tuple):
+        return (tuple,) + tuple(map(_spec_key, type_spec))
+    if isinstance(type_spec, dict):
+        return (dict, frozenset((key, _spec_key(value))
+                                for key, value in type_spec.items()))
+    return type_spec
+
+
+def _get_converter(type_spec):
+    key = _spec_key(type_spec)
+    converter = _converters.get(key)
+    if converter is not None:
+        return converter
+
+    cache = _find_class_cache(key)
+    if cache is None:
+        converter = _compile_converter(type_spec)
+        if len(_converters) >= _MAX_CONVERTERS:
+            _converters.clear()
+        _converters[key] = converter
+        return converter
+
+    converter = cache.get(key)
+    if converter is None:
+        converter = _compile_converter(type_spec)
+        cache[key] = converter
+    return converter
+
+
+# these must not hold on to the _TclInterpreter because they are cached
+# across teek.quit() calls
+
+def _convert_to_none(value):
+    return None
+
+
+def _convert_to_str(value):
+    return _get_interp().get_string(value)
+
+
+# _tkinter returns ints, floats and bools when tcl has them as numbers or
+# booleans internally, and those are used as is instead of doing a
+# 'format %s' call to convert them to strings and then parsing the strings
+
+
+def _convert_to_bool(value):
+    value_type = type(value)
+    if value_type is bool:
+        return value
+    if value_type is int:
+        return bool(value)
+    if value == '1':
+        return True
+    if value == '0':
+        return False
+
+    if not _convert_to_str(value):
+        # '' is not a valid bool, but this is usually what was intended
         return None
 
-    if type_spec is str:
-        return _get_interp().get_string(value)
+    try:
+        return _get_interp().getboolean(value)
+    except teek.TclError as e:
+        raise ValueError(str(e)).with_traceback(e.__traceback__) from None
 
-    if type_spec is bool:
-        if not from_tcl(str, value):
-            # '' is not a valid bool, but this is usually what was intended
-            return None
 
-        try:
-            return _get_interp().getboolean(value)
-        except teek.TclError as e:
-            raise ValueError(str(e)).with_traceback(e.__traceback__) from None
+# special case to allow bases other than 10 and empty strings
+def _convert_to_int(value):
+    if type(value) is int:
+        return value
+
+    string = _convert_to_str(value)
+    if not string:
+        return None
+    return int(string, 0)
+
 
-    # special case to allow bases other than 10 and empty strings
+# returns items of a tcl list
+#
+# if strings is true, the items will be converted to strings, and that needs
+# a 'format %s' call for each int, float, bool or tuple item, so then the list
+# is converted to a string with one call and split
+def _split_list(value, strings=False):
+    if isinstance(value, tuple):
+        if not strings or all(isinstance(item, (str, _tkinter.Tcl_Obj))
+                              for item in value):
+            return value
+    elif isinstance(value, (str, _tkinter.Tcl_Obj)):
+        return _get_interp().splitlist(value)
+    return _get_interp().splitlist(_convert_to_str(value))
+
+
+# true if the converter of type_spec converts its argument to a string
+def _needs_string(type_spec):
+    return type_spec is str or (
+        isinstance(type_spec, type) and
+        hasattr(type_spec, 'from_tcl') and
+        not issubclass(type_spec, numbers.Real))
+
+
+def _compile_converter(type_spec):
+    if type_spec is None:
+        return _convert_to_none
+    if type_spec is str:
+        return _convert_to_str
+    if type_spec is bool:
+        return _convert_to_bool
     if type_spec is int:
-        stringed_value = from_tcl(str, value)
-        if not stringed_value:
-            return None
-        return int(stringed_value, 0)
+        return _convert_to_int
 
     if isinstance(type_spec, type):     # it's a class
         if issubclass(type_spec, numbers.Real):     # must be after bool check
-            string = from_tcl(str, value)
-            if not string:
-                return None
-            return type_spec(string)
+            def convert_to_number(value):
+                if type(value) is type_spec:
+                    return value
+
+                string = _convert_to_str(value)
+                if not string:
+                    return None
+                return type_spec(string)
+
+            return convert_to_number
 
         if hasattr(type_spec, 'from_tcl'):
-            string = from_tcl(str, value)
+            def convert_with_from_tcl(value):
+                string = _convert_to_str(value)
+
+                # the empty string is the None value in tcl
+                if not string:
+                    return None
 
-            # the empty string is the None value in tcl
-            if not string:
-                return None
+                return type_spec.from_tcl(string)
 
-            return type_spec.from_tcl(string)
+            return convert_with_from_tcl
 
-    elif isinstance(type_spec, (list, tuple, dict)):
-        items = _get_interp().splitlist(from_tcl(str, value))
+    elif isinstance(type_spec, list):
+        # [int] -> [1, 2, 3]
+        (item_spec,) = type_spec
+        item_converter = _get_converter(item_spec)
+        strings = _needs_string(item_spec)
 
-        if isinstance(type_spec, list):
-            # [int] -> [1, 2, 3]
-            (item_spec,) = type_spec
-            return [from_tcl(item_spec, item) for item in items]
+        def convert_to_list(value):
+            return list(map(item_converter, _split_list(value, strings)))
 
-        if isinstance(type_spec, tuple):
-            # (int, str) -> (1, 'hello')
-            if len(type_spec) != len(items):
+        return convert_to_list
+
+    elif isinstance(type_spec, tuple):
+        # (int, str) -> (1, 'hello')
+        item_converters = tuple(map(_get_converter, type_spec))
+        strings = any(map(_needs_string, type_spec))
+
+        def convert_to_tuple(value):
+            items = _split_list(value, strings)
+            if len(item_converters) != len(items):
                 raise ValueError("expected a sequence of %d items, got %r"
-                                 % (len(type_spec), list(items)))
-            return tuple(map(from_tcl, type_spec, items))
+                                 % (len(item_converters), list(items)))
+            return tuple(converter(item) for converter, item
+                         in zip(item_converters, items))
+
+        return convert_to_tuple
 
-        if isinstance(type_spec, dict):
-            # {'a': int, 'b': str} -> {'a': 1, 'b': 'lol', 'c': 'str assumed'}
+    elif isinstance(type_spec, dict):
+        # {'a': int, 'b': str} -> {'a': 1, 'b': 'lol', 'c': 'str assumed'}
+        value_converters = {key: _get_converter(value_spec)
+                            for key, value_spec in type_spec.items()}
+
+        def convert_to_dict(value):
+            # the keys are always converted to strings
+            items = _split_list(value, True)
             result = {}
             for key, value in _pairs(items):
-                key = from_tcl(str, key)
-                result[key] = from_tcl(type_spec.get(key, str), value)
+                key = _convert_to_str(key)
+                result[key] = value_converters.get(key, _convert_to_str)(value)
             return result
 
-        raise RuntimeError("this should never happen")      # pragma: no cover
+        return convert_to_dict
 
     raise TypeError("unknown type specification " + repr(type_spec))
 
 
+def from_tcl(type_spec, value):
+    return _get_converter(type_spec)(value)
+
+
+def _call_converter(converter, value):
+    return converter(value)
+
+
+class _CallBatch:
+
+    def __init__(self):
+        # each item is a tuple of to_tcl()ed arguments for _TclInterpreter.call
+        self._calls = []
+
+    def add(self, tcl_args):
+        self._calls.append(tcl_args)
+
+    def flush(self):
+        calls = self._calls
+        self._calls = []
+        if calls:
+            if _stats.records is None:
+                _get_interp().call_many(calls)
+            else:
+                start = time.perf_counter()
+                _get_interp().call_many(calls)
+                _stats.record('tcl_calls', 'teek.batch()', python_time=0,
+                              tcl_time=(time.perf_counter() - start))
+
+
+# each thread has its own batch, because a batch started in one thread must not
+# swallow calls that some other thread (e.g. the event loop) is doing
+class _BatchState(threading.local):
+    current = None
+
+
+_batch_state = _BatchState()
+
+
+def _flush_batch():
+    if _batch_state.current is not None:
+        _batch_state.current.flush()
+
+
 def tcl_call(returntype, command, *arguments):
     """Call a Tcl command.
 
@@ -458,8 +969,52 @@ string"
         # doctest: +SKIP
     hello world thing
     """
-    result = _get_interp().call(tuple(map(to_tcl, (command,) + arguments)))
-    return from_tcl(returntype, result)
+    if _stats.records is not None:
+        return _tcl_call_with_stats(returntype, command, arguments)
+
+    tcl_args = tuple(map(to_tcl, (command,) + arguments))
+
+    if _batch_state.current is not None:
+        if returntype is None:
+            _batch_state.current.add(tcl_args)
+            return None
+        # the result is needed now, and the batched calls must run before
+        # this one to keep everything in the correct order
+        _batch_state.current.flush()
+
+    result = _get_interp().call(tcl_args)
+    return _get_converter(returntype)(result)
+
+
+# this is tcl_call() with timing stuff added, it's a separate function to
+# keep tcl_call() fast when stats are disabled
+def _tcl_call_with_stats(returntype, command, arguments):
+    start = time.perf_counter()
+    tcl_args = tuple(map(to_tcl, (command,) + arguments))
+    key = _stats.call_key(tcl_args)
+
+    if _batch_state.current is not None:
+        if returntype is None:
+            _batch_state.current.add(tcl_args)
+            _stats.record('tcl_calls', key, tcl_time=0,
+                          python_time=(time.perf_counter() - start))
+            return None
+        # the flush is recorded separately, so it's not timed here
+        python_time = time.perf_counter() - start
+        _batch_state.current.flush()
+        start = time.perf_counter()
+    else:
+        python_time = 0
+
+    converted = time.perf_counter()
+    result = _get_interp().call(tcl_args)
+    called = time.perf_counter()
+    value = _get_converter(returntype)(result)
+
+    python_time += (converted - start) + (time.perf_counter() - called)
+    _stats.record('tcl_calls', key, python_time=python_time,
+                  tcl_time=(called - converted))
+    return value
 
 
 def tcl_eval(returntype, code):
@@ -471,8 +1026,81 @@ def tcl_eval(returntype, code):
     >>> teek.tcl_call(int, 'add', 1, 2)     # usually this is better, see below
     3
     """
+    _flush_batch()
+    if _stats.records is None:
+        result = _get_interp().eval(code)
+        return _get_converter(returntype)(result)
+
+    start = time.perf_counter()
     result = _get_interp().eval(code)
-    return from_tcl(returntype, result)
+    evaluated = time.perf_counter()
+    value = _get_converter(returntype)(result)
+    _stats.record('tcl_calls', 'tcl_eval', tcl_time=(evaluated - start),
+                  python_time=(time.perf_counter() - evaluated))
+    return value
+
+
+@contextlib.contextmanager
+def batch():
+    """A context manager that does many Tcl calls at once.
+
+    Calls to :func:`tcl_call` with ``None`` as the return type are not done
+    right away inside a ``with teek.batch():`` block. Instead, they are
+    collected and done all at once when the ``with`` block ends:
+
+    >>> with teek.batch():
+    ...     teek.tcl_call(None, 'set', 'batch_example', 'hello')
+    ...     teek.tcl_call(None, 'append', 'batch_example', ' world')
+    ...
+    >>> teek.tcl_call(str, 'set', 'batch_example')
+    'hello world'
+
+    If a Tcl call whose return value is needed (that is, the return type is not
+    ``None``) is done inside the ``with`` block, the collected calls are done
+    before it. The same happens before anything else that goes to the event
+    loop, e.g. a widget method that is not batched (see below),
+    :func:`make_thread_safe` functions, :func:`call_soon_threadsafe` and
+    :func:`call_async`, so everything still happens in the correct order.
+
+    This is useful with :ref:`threads <threads>`. When a thread does a Tcl
+    call, it has to wait until the event loop has done the call, and that is
+    slow. The collected calls are sent to the event loop all at once, so the
+    thread waits only once. If one of the collected calls fails, the calls
+    after it are not done and :exc:`.TclError` is raised.
+
+    Most teek methods run in the event loop when they are called from a
+    thread, so their Tcl calls don't end up in the thread's batch. Setting
+    options with ``widget.config['option'] = value`` or
+    ``widget.config.update(...)`` is batched, and so is setting options of
+    other things that behave like config objects, e.g. :ref:`text widget tags
+    <textwidget-tags>`. :meth:`.Text.append` and :meth:`.Text.append_many`
+    are also batched, but :meth:`.Text.insert` isn't, because it needs to know
+    where the text ends, and that is asked from the event loop after each
+    change.
+
+    If the ``with`` block raises an exception, the collected calls are thrown
+    away instead of doing them, so they can't fail and hide the original
+    exception. Calls that were already done because a return value was needed
+    are not undone.
+
+    Each thread has its own batch, so a batch started in one thread does not
+    affect other threads. Using ``teek.batch()`` inside another
+    ``teek.batch()`` does nothing special; everything ends up in the outer
+    batch.
+    """
+    if _batch_state.current is not None:
+        yield
+        return
+
+    _batch_state.current = _CallBatch()
+    try:
+        yield
+    finally:
+        current_batch = _batch_state.current
+        _batch_state.current = None
+
+    # not reached if the with block raised an exception
+    current_batch.flush()
 
 
 # because there's no better place for this
@@ -491,7 +1119,8 @@ def update(*, idletasks_only=False):
 
 # TODO: maybe some magic that uses type hints for this?
 @make_thread_safe
-def create_command(func, arg_type_specs=(), *, extra_args_type=None):
+def create_command(func, arg_type_specs=(), *, extra_args_type=None,
+                   stats_key=None):
     """Create a Tcl command that calls ``func``.
 
     Here is a simple example:
@@ -535,11 +1164,36 @@ def create_command(func, arg_type_specs=(), *, extra_args_type=None):
     the Tcl command returns an empty string on errors and does *not* raise an
     error in Tcl. Be sure to return a non-empty value on success if you want to
     do error handling in Tcl code.
+
+    By default, :func:`.stats` shows calls of the command by the module and
+    name of ``func``. If ``func`` only calls some other function, that's not
+    very useful, and you can pass ``stats_key`` to use some other string
+    instead. It can also be a function that takes no arguments and returns
+    the string; that's called only when the stats are actually recorded.
     """
     # verbose is better than implicit
-    stack_info = ''.join(traceback.format_stack())
+    stack = _capture_stack(sys._getframe())
+
+    basic_converters = list(map(_get_converter, arg_type_specs))
+    extra_converter = _get_converter(extra_args_type)
+    if stats_key is None:
+        # most commands never run with stats enabled
+        stats_key = functools.partial(_stats.function_key, func)
 
     def real_func(*args):
+        if _stats.records is None:
+            return run_func(*args)
+
+        # the function may e.g. disconnect things from a Callback
+        key = stats_key if isinstance(stats_key, str) else stats_key()
+        start = time.perf_counter()
+        try:
+            return run_func(*args)
+        finally:
+            _stats.record('commands', key,
+                          time=(time.perf_counter() - start))
+
+    def run_func(*args):
         try:
             # python raises TypeError for wrong number of args
             if extra_args_type is None:
@@ -553,10 +1207,9 @@ def create_command(func, arg_type_specs=(), *, extra_args_type=None):
                                 % (expected, len(args)))
 
             # map(func, a, b) stops when the shortest of a and b ends
-            basic_args = map(from_tcl,
-                             arg_type_specs, args[:len(arg_type_specs)])
-            extra_args = (from_tcl(extra_args_type, arg)
-                          for arg in args[len(arg_type_specs):])
+            basic_args = map(_call_converter,
+                             basic_converters, args[:len(arg_type_specs)])
+            extra_args = map(extra_converter, args[len(arg_type_specs):])
 
             # func(*basic_args, *extra_args) doesn't work in 3.4
             # basic_args + extra_args doesn't work because they are iterators
@@ -564,10 +1217,14 @@ def create_command(func, arg_type_specs=(), *, extra_args_type=None):
 
         except Exception:
             traceback_blabla, rest = traceback.format_exc().split('\n', 1)
+            stack_info = '' if stack is None else stack.format()
             print(traceback_blabla + '\n' + stack_info + rest,
                   end='', file=sys.stderr)
             return ''
 
+    if _dispatcher_enabled:
+        return _get_interp().create_dispatched_command(real_func)
+
     name = 'teek_command_%d' % next(counts['commands'])
     _get_interp().createcommand(name, real_func)
     return name
@@ -580,4 +1237,53 @@ def delete_command(name):
     You can delete commands returned from :func:`create_command` to
     avoid memory leaks.
     """
-    _get_interp().deletecommand(name)
+    if name.startswith(_DISPATCHER_NAME + ' '):
+        _get_interp().delete_dispatched_command(name)
+    else:
+        _get_interp().deletecommand(name)
+
+
+def capture_stack_traces(enabled=True):
+    """Choose whether teek remembers where callbacks come from.
+
+    When a function passed to :func:`create_command` or
+    :meth:`.Callback.connect` raises an error, teek prints a traceback that
+    also shows where the :func:`create_command` or :meth:`~.Callback.connect`
+    call was, which is handy when debugging. By default, teek remembers that
+    for every callback. It's quite fast because the stack isn't formatted
+    until an error actually occurs, but if your program creates lots of
+    bindings, timeouts or other callbacks, you can make that faster with
+    ``capture_stack_traces(False)``. Then the tracebacks show only where the
+    error occurred.
+
+    This affects callbacks created after calling this function.
+    """
+    global _capturing_stacks
+    _capturing_stacks = bool(enabled)
+
+
+def use_command_dispatcher(enabled=True):
+    """Make :func:`create_command` faster, at the cost of compatibility.
+
+    By default, each :func:`create_command` call creates a new Tcl command
+    with a name like ``teek_command_123``. When the dispatcher is enabled,
+    :func:`create_command` instead stores the function in a dict and returns
+    a string like ``'teek_dispatch 123'``, and there is only one Tcl command
+    named ``teek_dispatch``; it looks up the function from the dict by its
+    number and calls it. This uses less memory and makes creating and
+    deleting commands faster, which matters in programs that create lots of
+    bindings or timeouts.
+
+    The catch is that ``'teek_dispatch 123'`` is not a command name; it's a
+    command name and an argument. Teek only uses the strings returned from
+    :func:`create_command` in Tcl code and as options like ``-command``, so
+    this works, but if your code does ``teek.tcl_call(None, command, ...)``
+    with a ``command`` from :func:`create_command`, you need to change it to
+    ``teek.tcl_call(None, *command.split(), ...)``.
+
+    Commands created before calling this function keep working, and
+    :func:`delete_command` works with both kinds of commands. Use
+    ``use_command_dispatcher(False)`` to go back to the default.
+    """
+    global _dispatcher_enabled
+    _dispatcher_enabled = bool(enabled)
@@ -1,4 +1,7 @@
+import functools
+
 import teek
+from teek import _stats
 from teek._tcl_calls import make_thread_safe
 
 
@@ -16,7 +19,9 @@ class _Timeout:
         self._kwargs = kwargs
 
         self._state = 'pending'   # just for __repr__ and error messages
-        self._tcl_command = teek.create_command(self._run)
+        self._tcl_command = teek.create_command(
+            self._run, stats_key=functools.partial(
+                _stats.function_key, callback))
         self._id = teek.tcl_call(str, 'after', after_what, self._tcl_command)
 
     def __repr__(self):
@@ -2,12 +2,15 @@ import collections.abc
 import contextlib
 import functools
 import keyword
-import operator
+import math
 import re
+import time
 
 import teek
-from teek._tcl_calls import counts, from_tcl, make_thread_safe
-from teek._structures import ConfigDict, CgetConfigureConfigDict, after_quit
+from teek._tcl_calls import (
+    counts, from_tcl, make_thread_safe, _get_converter)
+from teek._structures import (
+    ConfigDict, CgetConfigureConfigDict, after_quit, _options_cache)
 
 _widgets = {}
 _class_bindings = {}
@@ -77,9 +80,22 @@ class GridRowOrColumnConfig(ConfigDict):
     def _set(self, option, value):
         self._configure(None, '-' + option, value)
 
+    def _set_many(self, options):
+        args = []
+        for option, value in options.items():
+            args.extend(['-' + option, value])
+        self._configure(None, *args)
+
     def _get(self, option):
         return self._configure(self._types.get(option, str), '-' + option)
 
+    def _get_all(self):
+        result = {}
+        for key, value in self._configure({}).items():
+            option = key.lstrip('-')
+            result[option] = from_tcl(self._types.get(option, str), value)
+        return result
+
     def _list_options(self):
         return (key.lstrip('-') for key in self._configure({}).keys())
 
@@ -161,6 +177,14 @@ class Widget:
          'text': 'Even newer text',
          ...}
 
+        ``dict(label.config)`` gets the values of the options one by one, but
+        ``label.config.snapshot()`` returns the same dict faster because it
+        gets all values at once. Similarly, ``label.config.update()`` sets
+        all options at once.
+
+        >>> label.config.snapshot()['text']
+        'Even newer text'
+
     .. attribute:: state
 
         Represents the Ttk state of the widget. The state object behaves like a
@@ -236,13 +260,9 @@ class Widget:
         self._widget_path = '%s.%s%d' % (
             parentpath, safe_class_name, next(counts[safe_class_name]))
 
-        # TODO: some config options can only be given when the widget is
-        # created, add support for them
-        self._call(None, type(self)._widget_name, self.to_tcl())
-        _widgets[self.to_tcl()] = self
-
         self.config = CgetConfigureConfigDict(
-            lambda returntype, *args: self._call(returntype, self, *args))
+            lambda returntype, *args: self._call(returntype, self, *args),
+            type(self)._widget_name)
         self._init_config()     # subclasses should override this and use super
 
         # support kwargs like from_=1, because from=1 is invalid syntax
@@ -250,16 +270,63 @@ class Widget:
             if invalid_syntax + '_' in kwargs:
                 kwargs[invalid_syntax] = kwargs.pop(invalid_syntax + '_')
 
-        self.config.update(kwargs)
+        # options are given to the widget creating command, so that there's
+        # no need to configure them separately and options that can be set
+        # only when creating the widget work, but the special options need
+        # an existing widget (their error messages may create commands)
+        creating_args = []
+        special_kwargs = {}
+        for option, value in kwargs.items():
+            if option in self.config._special:
+                special_kwargs[option] = value
+            else:
+                creating_args.extend(['-' + option, value])
+
+        try:
+            # self._call() would complain about a destroyed widget, and the
+            # return type is not None because the widget must be created now
+            # even inside teek.batch(), so that errors are handled below
+            teek.tcl_call(str, type(self)._widget_name, self.to_tcl(),
+                          *creating_args)
+        except teek.TclError as e:
+            # tk's old option code says "ambiguous option" when e.g. -h
+            # could mean -height or -highlightcolor
+            match = re.match(r'^(?:unknown|ambiguous) option "-([^"]*)"',
+                             str(e))
+            if match is None:
+                raise
+            raise KeyError(match.group(1)) from None
+
+        # tk allows abbreviating options, e.g. -tex instead of -text, but
+        # teek doesn't do that anywhere else either, and the widget must not
+        # be left behind when that happens
+        try:
+            for option in kwargs:
+                self.config._check_option(option)
+        except KeyError:
+            teek.tcl_call(None, 'destroy', self.to_tcl())
+            raise
+        _widgets[self.to_tcl()] = self
 
         # command strings that are deleted when the widget is destroyed
         self.command_list = []
 
+        # bind(coalesce=True) and bind(max_rate_hz=...) handlers whose pending
+        # timeouts are cancelled when the widget is destroyed
+        self._coalescing_handlers = []
+
+        # child widgets created by teek, used in destroy()
+        self._children = set()
+        if parent is not None:
+            parent._children.add(self)
+
+        self.config.update(special_kwargs)
+
         self.bindings = BindingDict(    # BindingDict is defined below
             lambda returntype, *args: self._call(
                 returntype, 'bind', self, *args
             ),
-            self.command_list)
+            self.command_list, self._coalescing_handlers)
         self.bind = self.bindings._convenience_bind
 
         if type(self)._widget_name.startswith('ttk::'):
@@ -368,6 +435,19 @@ class Widget:
         """Returns the widget's Tcl command name. See :meth:`from_tcl`."""
         return self._widget_path
 
+    @classmethod
+    @make_thread_safe
+    def forget_config_options(cls):
+        """Makes teek ask Tk which options the widgets have.
+
+        teek asks Tk for the names of the options only once for each kind of
+        widget, and remembers them until :func:`.quit` is called. That's fine
+        because the options of a Tk widget never change, but if you have a
+        custom widget that gets new options after it has been used with teek,
+        call this method after adding the options.
+        """
+        _options_cache.pop(cls._widget_name, None)
+
     def __repr__(self):
         class_name = type(self).__name__
         if getattr(teek, class_name, None) is type(self):
@@ -390,7 +470,8 @@ class Widget:
 
     def _create_scroll_callback(self, option_name):
         result = teek.Callback()
-        command_string = teek.create_command(result.run, [float, float])
+        command_string = teek.create_command(
+            result.run, [float, float], stats_key=result._stats_key)
         self.command_list.append(command_string)
         self._call(None, self, 'configure', '-' + option_name, command_string)
         return result
@@ -443,29 +524,29 @@ class Widget:
             >>> teek.quit()
             destroying
         """
-        for name in self._call([str], 'winfo', 'children', self):
-            # allow overriding the destroy() method if the widget was
-            # created by teek
-            if name in _widgets:
-                _widgets[name]._destroy_recurser()
-            else:
-                self._call(None, 'destroy', name)
-
-        # this must be BEFORE deleting command_list commands because <Destroy>
-        # bindings may need command_list stuff
+        # tk destroys the child widgets too, and this must be BEFORE deleting
+        # command_list commands because <Destroy> bindings may need
+        # command_list stuff
         self._call(None, 'destroy', self)
 
-        # this is here because now the widget is basically useless
-        del _widgets[self.to_tcl()]
+        if self.parent is not None:
+            self.parent._children.discard(self)
 
-        for command in self.command_list:
-            teek.delete_command(command)
-        self.command_list.clear()      # why not
+        # now the widgets are basically useless
+        to_clean_up = [self]
+        while to_clean_up:
+            widget = to_clean_up.pop()
+            to_clean_up.extend(widget._children)
+            widget._children.clear()
+            _widgets.pop(widget.to_tcl(), None)
 
-    # can be overrided when .destroy() in .destroy() would cause infinite
-    # recursion, see Window in windows.py
-    def _destroy_recurser(self):
-        self.destroy()
+            for handler in widget._coalescing_handlers:
+                handler.cancel()
+            widget._coalescing_handlers.clear()
+
+            for command in widget.command_list:
+                teek.delete_command(command)
+            widget.command_list.clear()      # why not
 
     @_ClassProperty
     @make_thread_safe
@@ -488,8 +569,9 @@ class Widget:
 
             # all commands are deleted when the interpreter shuts down, and the
             # binding dict created here should be alive until then, so it's
-            # fine to pass a new empty list for command list
-            bindings = BindingDict(call_bind, [])
+            # fine to pass new empty lists for command list and coalescing
+            # handlers
+            bindings = BindingDict(call_bind, [], [])
             _class_bindings[bindtag] = bindings
             return bindings
 
@@ -723,9 +805,59 @@ _BIND_SUBS = [
     ('%Y', int, 'rooty'),
 ]
 
+# type specs of _BIND_SUBS compiled, because events can come very often
+_BIND_SUB_CONVERTERS = {
+    attrib: _get_converter(type_) for _, type_, attrib in _BIND_SUBS}
+_ALL_BIND_ATTRIBS = frozenset(attrib for _, _, attrib in _BIND_SUBS)
+
+
+def _convert_bind_sub(attrib, string_value):
+    try:
+        return _BIND_SUB_CONVERTERS[attrib](string_value)
+    except (ValueError, teek.TclError) as e:
+        if string_value == '??':
+            return None
+        if attrib == 'sendevent':
+            # this seems to be a bug in Tk, here's a minimal example:
+            #
+            #    label .lab -text "click this to do the bug"
+            #    pack .lab
+            #    bind .lab <Leave> { puts "leave: %E" }
+            #    bind .lab <Button-1> { tk_messageBox }
+            #
+            # for me this prints "leave: 343089580", even though
+            # bind(3tk) says that %E is 1 or 0
+            return None
+        raise e     # pragma: no cover
+
 
 class Event:
 
+    # the attributes are converted from strings when they are accessed for
+    # the first time, because most callbacks use only a few of them
+    __slots__ = ['_strings'] + sorted(_ALL_BIND_ATTRIBS)
+
+    def __init__(self, strings):
+        self._strings = strings     # {attrib: string from tcl}
+
+    def __getattr__(self, attrib):
+        # this runs only if the attribute hasn't been set yet
+        if attrib == '_strings':
+            # this would recurse infinitely, copy.copy() does this
+            raise AttributeError(attrib)
+        try:
+            string_value = self._strings[attrib]
+        except KeyError:
+            if attrib in _ALL_BIND_ATTRIBS:
+                raise AttributeError(
+                    "%r was not given to bind(..., event=...)"
+                    % ('data' if attrib == '_data' else attrib)) from None
+            raise AttributeError(attrib) from None
+
+        value = _convert_bind_sub(attrib, string_value)
+        setattr(self, attrib, value)
+        return value
+
     def __repr__(self):
         # try to avoid making the repr too verbose
         ignored_names = ['widget', 'sendevent', 'subwindow', 'time',
@@ -733,8 +865,8 @@ class Event:
         ignored_values = [None, '??', -1, 0]
 
         pairs = []
-        for name, value in sorted(self.__dict__.items(),
-                                  key=operator.itemgetter(0)):
+        for name in sorted(self._strings):
+            value = getattr(self, name)
             if name not in ignored_names and value not in ignored_values:
                 display_name = 'data' if name == '_data' else name
                 pairs.append('%s=%r' % (display_name, value))
@@ -745,14 +877,87 @@ class Event:
         return from_tcl(type_spec, self._data)
 
 
+# {sequence: canonical sequence}, e.g. {'<1>': '<Button-1>'}
+_canonical_sequences = {}
+after_quit.connect(_canonical_sequences.clear)
+_CANONICALIZING_BINDTAG = 'teek_canonical_sequences'
+
+
+def _canonicalize_sequence(sequence):
+    # tk returns bound sequences in a canonical form, and this binding
+    # tag isn't used by any widget so binding it does nothing
+    try:
+        return _canonical_sequences[sequence]
+    except KeyError:
+        teek.tcl_call(None, 'bind', _CANONICALIZING_BINDTAG, sequence, ' ')
+        try:
+            [result] = teek.tcl_call([str], 'bind', _CANONICALIZING_BINDTAG)
+        finally:
+            teek.tcl_call(None, 'bind', _CANONICALIZING_BINDTAG, sequence, '')
+        _canonical_sequences[sequence] = result
+        return result
+
+
+class _CoalescingHandler:
+
+    # runs func with the latest event when tk is idle, but if interval_ms is
+    # not None, waits until interval_ms has passed since the previous run
+    def __init__(self, func, interval_ms):
+        self._func = func
+        self._interval_ms = interval_ms
+        self._latest_event = None
+        self._timeout = None
+        self._last_run = None
+
+        # teek.stats() shows this and the timeouts like func, see
+        # _stats.function_key()
+        self.__wrapped__ = func
+        self._run_later = functools.wraps(func)(lambda: self._run())
+
+    def __call__(self, event):
+        self._latest_event = event
+        if self._timeout is not None:
+            return
+
+        delay_ms = 0
+        if self._interval_ms is not None and self._last_run is not None:
+            elapsed_ms = (time.monotonic() - self._last_run) * 1000
+            delay_ms = math.ceil(self._interval_ms - elapsed_ms)
+
+        if delay_ms > 0:
+            self._timeout = teek.after(delay_ms, self._run_later)
+        else:
+            self._timeout = teek.after_idle(self._run_later)
+
+    # the widget is being destroyed, and the event must not be used after that
+    def cancel(self):
+        if self._timeout is not None:
+            self._timeout.cancel()
+            self._timeout = None
+        self._latest_event = None
+
+    def _run(self):
+        event = self._latest_event
+        self._latest_event = None
+        self._timeout = None
+        self._last_run = time.monotonic()
+        self._func(event)
+
+
 class BindingDict(collections.abc.Mapping):
 
     # bind(3tk) calls things like '<Button-1>' sequences, so this code is
     # consistent with that
-    def __init__(self, bind_caller, command_list):
+    def __init__(self, bind_caller, command_list, coalescing_handlers):
         self._call_bind = bind_caller
         self.command_list = command_list
-        self._callback_objects = {}     # {sequence: callback}
+        self._coalescing_handlers = coalescing_handlers
+        # {canonical sequence: callback}, see _canonicalize_sequence()
+        self._callback_objects = {}
+
+        # {callback: (command, attribs)}, where attribs is a tuple of the
+        # event attributes that tcl substitutes
+        self._bind_infos = {}
 
     def __repr__(self):
         return '<a bindings object, behaves like a dict>'
@@ -764,65 +969,88 @@ class BindingDict(collections.abc.Mapping):
     def __len__(self):
         return len(self._call_bind([str]))
 
-    def _callback_runner(self, callback, *args):
-        assert len(args) == len(_BIND_SUBS)
-
-        event = Event()
-        for (character, type_, attrib), string_value in zip(_BIND_SUBS, args):
-            assert isinstance(string_value, str)
-            try:
-                value = from_tcl(type_, string_value)
-            except (ValueError, teek.TclError) as e:
-                if string_value == '??':
-                    value = None
-                elif attrib == 'sendevent':
-                    # this seems to be a bug in Tk, here's a minimal example:
-                    #
-                    #    label .lab -text "click this to do the bug"
-                    #    pack .lab
-                    #    bind .lab <Leave> { puts "leave: %E" }
-                    #    bind .lab <Button-1> { tk_messageBox }
-                    #
-                    # for me this prints "leave: 343089580", even though
-                    # bind(3tk) says that %E is 1 or 0
-                    value = None
-                else:   # pragma: no cover
-                    raise e     # if this runs, there's a bug in teek
-
-            setattr(event, attrib, value)
-
-        return callback.run(event)
+    def _callback_runner(self, callback, attribs, *string_values):
+        assert len(string_values) == len(attribs)
+        return callback.run(Event(dict(zip(attribs, string_values))))
 
-    def __getitem__(self, sequence):
-        if sequence in self._callback_objects:
-            return self._callback_objects[sequence]
+    @staticmethod
+    def _script(command, attribs):
+        command_string = ' '.join([command] + [
+            subs for subs, type_, attrib in _BIND_SUBS if attrib in attribs])
+        return 'if { [%s] eq {break} } { break }' % command_string
 
+    def _get_callback(self, sequence, attribs):
         # <1> and <Button-1> are equivalent, this handles that
-        for equiv_sequence, equiv_callback in self._callback_objects.items():
-            # this equivalence check should handle corner cases imo because the
-            # command names from create_command are unique
-            if (self._call_bind(str, sequence) ==
-                self._call_bind(str, equiv_sequence)):      # noqa: E129
-                # found an equivalent binding, tcl commands are the same
-                self._callback_objects[sequence] = equiv_callback
-                return equiv_callback
-
-        callback = teek.Callback()
-        runner = functools.partial(self._callback_runner, callback)
-        command = teek.create_command(runner, [str] * len(_BIND_SUBS))
+        sequence = _canonicalize_sequence(sequence)
+        try:
+            callback = self._callback_objects[sequence]
+        except KeyError:
+            callback = teek.Callback()
+            old_command = None
+            old_attribs = ()
+        else:
+            old_command, old_attribs = self._bind_infos[callback]
+            if attribs <= set(old_attribs):
+                return callback
+
+        new_attribs = tuple(attrib for _, _, attrib in _BIND_SUBS
+                            if attrib in attribs or attrib in old_attribs)
+        runner = functools.partial(
+            self._callback_runner, callback, new_attribs)
+        command = teek.create_command(runner, [str] * len(new_attribs),
+                                      stats_key=callback._stats_key)
         self.command_list.append(command)      # avoid memory leaks
 
-        subs_string = ' '.join(subs for subs, type_, name in _BIND_SUBS)
-        self._call_bind(
-            None, sequence, '+ if { [%s %s] eq {break} } { break }' % (
-                command, subs_string))
+        if old_command is None:
+            self._call_bind(None, sequence,
+                            '+' + self._script(command, new_attribs))
+        else:
+            # the binding script may contain other things than the teek
+            # command, e.g. from tcl code, and they must stay there
+            script = self._call_bind(str, sequence).replace(
+                self._script(old_command, old_attribs),
+                self._script(command, new_attribs))
+            self._call_bind(None, sequence, script)
+            self.command_list.remove(old_command)
+            teek.delete_command(old_command)
 
         self._callback_objects[sequence] = callback
+        self._bind_infos[callback] = (command, new_attribs)
         return callback
 
+    def __getitem__(self, sequence):
+        # the callback can be connected to anything that wants all event
+        # attributes
+        return self._get_callback(sequence, _ALL_BIND_ATTRIBS)
+
     # any_widget.bind is set to this
-    def _convenience_bind(self, sequence, func, *, event=False):
-        self[sequence].connect(func if event else (lambda event: func()))
+    def _convenience_bind(self, sequence, func, *, event=False,
+                          coalesce=False, max_rate_hz=None):
+        if event is True:
+            attribs = _ALL_BIND_ATTRIBS
+            handler = func
+        elif event is False:
+            attribs = frozenset()
+            handler = functools.wraps(func)(lambda event: func())
+        else:
+            attribs = {'_data' if attrib == 'data' else attrib
+                       for attrib in event}
+            if not attribs <= _ALL_BIND_ATTRIBS:
+                raise ValueError("unknown event attributes: " + ', '.join(
+                    sorted(map(repr, attribs - _ALL_BIND_ATTRIBS))))
+            handler = func
+
+        if max_rate_hz is not None:
+            if max_rate_hz <= 0:
+                raise ValueError("max_rate_hz must be positive, not %r"
+                                 % (max_rate_hz,))
+            handler = _CoalescingHandler(handler, 1000 / max_rate_hz)
+            self._coalescing_handlers.append(handler)
+        elif coalesce:
+            handler = _CoalescingHandler(handler, None)
+            self._coalescing_handlers.append(handler)
+
+        self._get_callback(sequence, attribs).connect(handler)
 
 
 # TODO: "RELATIVE PLACEMENT" in grid(3tk)
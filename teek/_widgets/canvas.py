@@ -73,7 +73,8 @@ class CanvasItem:
         self._id = id_
 
         self.tags = Tags(self)
-        self.config = CgetConfigureConfigDict(self._config_caller)
+        self.config = CgetConfigureConfigDict(
+            self._config_caller, ('canvas item', type_string))
 
         prefixed = {
             #'stipple': ???,
@@ -167,7 +168,8 @@ class Canvas(ChildMixin, Widget):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.Item = type('Item', (CanvasItem,), {'canvas': self})
+        self.Item = type('Item', (CanvasItem,),
+                         {'canvas': self, '_teek_converters': {}})
 
     def _init_config(self):
         super()._init_config()
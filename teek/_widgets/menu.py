@@ -90,7 +90,8 @@ class MenuItem:
         self._menu = None
         self._index = None
 
-        self.config = CgetConfigureConfigDict(self._config_entrycommand_caller)
+        self.config = CgetConfigureConfigDict(
+            self._config_entrycommand_caller, ('menu item', self.type))
         self.config._types.update({
             'activebackground': teek.Color,
             'activeforeground': teek.Color,
@@ -160,7 +161,8 @@ class MenuItem:
     def _create_command(self):
         self._check_in_menu()
         result = teek.Callback()
-        command_string = teek.create_command(result.run)
+        command_string = teek.create_command(
+            result.run, stats_key=result._stats_key)
         teek.tcl_call(None, self._menu, 'entryconfigure', self._index,
                       '-command', command_string)
         self._menu.command_list.append(command_string)
@@ -46,7 +46,8 @@ class Button(ChildMixin, Widget):
 
     def _create_click_command(self):
         result = teek.Callback()
-        command_string = teek.create_command(result.run)
+        command_string = teek.create_command(
+            result.run, stats_key=result._stats_key)
         self.command_list.append(command_string)
         self._call(None, self, 'configure', '-command', command_string)
         return result
@@ -105,7 +106,8 @@ class Checkbutton(ChildMixin, Widget):
 
     def _create_check_command(self):
         result = teek.Callback()
-        command_string = teek.create_command(self._command_runner)
+        command_string = teek.create_command(
+            self._command_runner, stats_key=result._stats_key)
         self.command_list.append(command_string)
         self._call(None, self, 'configure', '-command', command_string)
         return result
@@ -223,7 +225,8 @@ class Spinbox(Entry):
 
     def _create_spin_command(self):
         result = teek.Callback()
-        command_string = teek.create_command(result.run)
+        command_string = teek.create_command(
+            result.run, stats_key=result._stats_key)
         self.command_list.append(command_string)
         self._call(None, self, 'configure', '-command', command_string)
         return result
@@ -492,7 +495,8 @@ class Scrollbar(ChildMixin, Widget):
     def _create_scrolling_command(self):
         result = teek.Callback()
         command_string = teek.create_command(
-            self._command_runner, extra_args_type=str)
+            self._command_runner, extra_args_type=str,
+            stats_key=result._stats_key)
         self.command_list.append(command_string)
         self._call(None, self, 'configure', '-command', command_string)
         return result
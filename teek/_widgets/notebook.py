@@ -3,7 +3,7 @@ import weakref
 
 import teek
 from teek._structures import ConfigDict
-from teek._tcl_calls import make_thread_safe
+from teek._tcl_calls import from_tcl, make_thread_safe
 from teek._widgets.base import ChildMixin, Widget
 
 
@@ -28,12 +28,29 @@ class TabConfigDict(ConfigDict):
         teek.tcl_call(None, self._tab.widget.parent,
                       'tab', self._tab.widget, '-' + option, value)
 
+    def _set_many(self, options):
+        self._tab._check_in_notebook()
+        args = []
+        for option, value in options.items():
+            args.extend(['-' + option, value])
+        teek.tcl_call(None, self._tab.widget.parent,
+                      'tab', self._tab.widget, *args)
+
     def _get(self, option):
         self._tab._check_in_notebook()
         return teek.tcl_call(self._types.get(option, str),
                              self._tab.widget.parent, 'tab', self._tab.widget,
                              '-' + option)
 
+    def _get_all(self):
+        self._tab._check_in_notebook()
+        result = {}
+        for key, value in teek.tcl_call({}, self._tab.widget.parent,
+                                        'tab', self._tab.widget).items():
+            option = key.lstrip('-')
+            result[option] = from_tcl(self._types.get(option, str), value)
+        return result
+
     def _list_options(self):
         self._tab._check_in_notebook()
         for option in teek.tcl_call({}, self._tab.widget.parent,
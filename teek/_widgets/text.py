@@ -24,10 +24,11 @@ class IndexBase(collections.namedtuple('TextIndex', 'line column')):
         if re.fullmatch(r'(\d+)\.(\d+)', string) is None:
             string = cls._widget._call(str, cls._widget, 'index', string)
 
-            # hide the invisible newline that tk wants to have at the end
-            tk_fake_end = cls._widget._call(str, cls._widget, 'index', 'end')
-            if string == tk_fake_end:
-                return cls._widget.end
+            # hide the invisible newline that tk wants to have at the end,
+            # tk's end is always at the beginning of the line after teek's end
+            end = cls._widget.end
+            if string == '%d.0' % (end.line + 1):
+                return end
 
         return cls(*map(int, string.split('.')))
 
@@ -62,7 +63,7 @@ class Tag(CgetConfigureConfigDict):
     def __init__(self, widget, name):
         self._widget = widget
         self.name = name
-        super().__init__(self._call_tag_subcommand)
+        super().__init__(self._call_tag_subcommand, 'text tag')
 
         self._types.update({
             'background': teek.Color,
@@ -95,7 +96,8 @@ class Tag(CgetConfigureConfigDict):
             'wrap': str,
         })
 
-        self.bindings = BindingDict(self._call_bind, widget.command_list)
+        self.bindings = BindingDict(self._call_bind, widget.command_list,
+                                    widget._coalescing_handlers)
         self.bind = self.bindings._convenience_bind
 
     def __repr__(self):
@@ -126,6 +128,22 @@ class Tag(CgetConfigureConfigDict):
         index2 = self._widget._get_index_obj(index2)
         return self._call_tag_subcommand(None, 'add', index1, index2)
 
+    def _call_with_ranges(self, subcommand, ranges):
+        indexes = []
+        for index1, index2 in ranges:
+            indexes.extend([index1, index2])
+        indexes = self._widget._get_index_objs(indexes)
+        if indexes:
+            self._call_tag_subcommand(None, subcommand, *indexes)
+
+    @make_thread_safe
+    def add_ranges(self, ranges):
+        self._call_with_ranges('add', ranges)
+
+    @make_thread_safe
+    def remove_ranges(self, ranges):
+        self._call_with_ranges('remove', ranges)
+
     # TODO: bind
 
     def delete(self):
@@ -217,6 +235,52 @@ class MarksDict(collections.abc.MutableMapping):
         self._widget._call(None, self._widget, 'mark', 'unset', name)
 
 
+# Text caches its end, and this runs after each call of the widget command
+# (including calls from tk's bindings, e.g. when the user types something) to
+# forget the cached end when the text may have changed
+#
+# <<Modified>> isn't enough because it runs only when the modified flag gets
+# set, not for each change
+#
+# forget_end is expanded with {*} because use_command_dispatcher() makes
+# create_command() return 2 words
+#
+# tk allows abbreviating the subcommands, e.g. '.t ins end hello' inserts, so
+# anything that isn't a full subcommand name is looked up from all subcommands
+# of the text widget like tk does it; tcl::prefix would do that, but it's new
+# in tcl 8.6
+_END_TRACE_LAMBDA = '''{forget_end command_string args} {
+    set subcommand [lindex $command_string 1]
+    set all {bbox cget compare configure count debug delete dlineinfo dump
+             edit get image index insert mark peer pendingsync replace scan
+             search see sync tag window xview yview}
+    if {$subcommand ni $all} {
+        set matches {}
+        foreach name $all {
+            if {[string first $subcommand $name] == 0} {
+                lappend matches $name
+            }
+        }
+        if {[llength $matches] != 1} {
+            return
+        }
+        set subcommand [lindex $matches 0]
+    }
+    if {$subcommand in {insert delete replace edit image window configure}} {
+        {*}$forget_end
+    }
+}'''
+
+
+# text search doesn't return the lengths of the matches, it sets a variable
+_SEARCH_LAMBDA = '''{widget options pattern index1 index2} {
+    set counts {}
+    set indexes [$widget search -count counts {*}$options -- \\
+                 $pattern $index1 $index2]
+    return [list $indexes $counts]
+}'''
+
+
 class Text(ChildMixin, Widget):
     r"""This is the text widget.
 
@@ -280,7 +344,14 @@ class Text(ChildMixin, Widget):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self.TextIndex = type(     # creates a new subclass of IndexBase
-            'TextIndex', (IndexBase,), {'_widget': self})
+            'TextIndex', (IndexBase,),
+            {'_widget': self, '_teek_converters': {}})
+
+        self._end = None
+        forget_end = teek.create_command(self._forget_end)
+        self.command_list.append(forget_end)
+        self._call(None, 'trace', 'add', 'execution', self, 'leave',
+                   ['apply', _END_TRACE_LAMBDA, forget_end])
         self._tag_objects = {}
         self.marks = MarksDict(self)
 
@@ -312,12 +383,20 @@ class Text(ChildMixin, Widget):
         return ['contains %d lines of text' % self.end.line]
 
     def _get_index_obj(self, index):
-        if isinstance(index, str):
-            raise TypeError(
-                "string indexes are not supported, use (line, column) int "
-                "tuples or TextIndex objects instead")
-
-        return self.TextIndex(*index).between_start_end()
+        return self._get_index_objs([index])[0]
+
+    # like between_start_end() for each index, but gets start and end once
+    def _get_index_objs(self, indexes):
+        start = self.start
+        end = self.end
+        result = []
+        for index in indexes:
+            if isinstance(index, str):
+                raise TypeError(
+                    "string indexes are not supported, use (line, column) "
+                    "int tuples or TextIndex objects instead")
+            result.append(min(max(self.TextIndex(*index), start), end))
+        return result
 
     @make_thread_safe
     def get_tag(self, name):
@@ -349,10 +428,16 @@ class Text(ChildMixin, Widget):
     def start(self):
         return self.TextIndex(1, 0)
 
+    def _forget_end(self):
+        self._end = None
+
     @property
+    @make_thread_safe
     def end(self):
-        index_string = self._call(str, self, 'index', 'end - 1 char')
-        return self.TextIndex(*map(int, index_string.split('.')))
+        if self._end is None:
+            index_string = self._call(str, self, 'index', 'end - 1 char')
+            self._end = self.TextIndex(*map(int, index_string.split('.')))
+        return self._end
 
     @make_thread_safe
     def get(self, index1=None, index2=None):
@@ -373,6 +458,54 @@ class Text(ChildMixin, Widget):
 
         return self._call(str, self, 'get', index1, index2)
 
+    @make_thread_safe
+    def search(self, pattern, index1=None, index2=None, *,
+               regexp=False, nocase=False, all=False):
+        """Find text in the widget.
+
+        This returns a list of ``(index, length)`` tuples, where ``index`` is
+        a :ref:`TextIndex <textwidget-index>` of where the match starts and
+        ``length`` is the number of characters in it. The search begins at
+        ``index1`` and stops at ``index2``; these default to
+        the beginning and end of the text widget, respectively.
+
+        By default, ``pattern`` is searched as is, only the first match is
+        returned and the search is case-sensitive. Pass ``regexp=True`` to
+        treat ``pattern`` as a Tcl regular expression, ``all=True`` to get
+        all matches, and ``nocase=True`` to ignore case. All matches are
+        found with one Tcl call, so ``all=True`` is much faster than
+        calling this method in a loop.
+
+        >>> text = teek.Text(teek.Window())
+        >>> text.insert(text.start, 'Hello hello')
+        >>> text.search('hello')
+        [(TextIndex(line=1, column=6), 5)]
+        >>> text.search('h[a-z]*', regexp=True, nocase=True, all=True)
+        [(TextIndex(line=1, column=0), 5), (TextIndex(line=1, column=6), 5)]
+        >>> text.search('hi')
+        []
+
+        See ``pathName search`` in :man:`text(3tk)` for details.
+        """
+        index1 = self.start if index1 is None else self._get_index_obj(index1)
+        index2 = self.end if index2 is None else self._get_index_obj(index2)
+
+        options = ['-regexp' if regexp else '-exact']
+        if nocase:
+            options.append('-nocase')
+        if all:
+            options.append('-all')
+
+        index_strings, lengths = self._call(
+            ([str], [int]), 'apply', _SEARCH_LAMBDA, self, options,
+            pattern, index1, index2)
+
+        # search returns 'line.column' strings that are never out of bounds,
+        # so there's no need to call TextIndex.from_tcl() for each of them
+        TextIndex = self.TextIndex
+        return [(TextIndex(*map(int, string.split('.'))), length)
+                for string, length in zip(index_strings, lengths)]
+
     @make_thread_safe
     def insert(self, index, text, tag_list=()):
         """Add text to the widget.
@@ -383,6 +516,27 @@ class Text(ChildMixin, Widget):
         index = self._get_index_obj(index)
         self._call(None, self, 'insert', index, text, tag_list)
 
+    def append(self, text, tag_list=()):
+        """Add text to the end of the widget.
+
+        This does the same thing as ``insert(widget.end, text, tag_list)``,
+        but with only one Tcl call, so it's also faster from a thread.
+        """
+        self._call(None, self, 'insert', 'end - 1 char', text, tag_list)
+
+    def append_many(self, text_and_tags):
+        """Add several chunks of text to the end of the widget at once.
+
+        ``text_and_tags`` should be an iterable of ``(text, tag_list)`` pairs,
+        and everything is added with one Tcl call. Use this instead of calling
+        :meth:`append` in a loop if you have a lot of text to add.
+        """
+        args = []
+        for text, tag_list in text_and_tags:
+            args.extend([text, tag_list])
+        if args:
+            self._call(None, self, 'insert', 'end - 1 char', *args)
+
     @make_thread_safe
     def replace(self, index1, index2, new_text, tag_list=()):
         """See :man:`text(3tk)` and :meth:`insert`."""
@@ -22,10 +22,12 @@ class WmMixin:
         # TODO: delete the commands when they are no longer needed, mem leak
         self._call(
             None, 'wm', 'protocol', self._get_wm_widget(), 'WM_DELETE_WINDOW',
-            teek.create_command(self.on_delete_window.run))
+            teek.create_command(self.on_delete_window.run,
+                                stats_key=self.on_delete_window._stats_key))
         self._call(
             None, 'wm', 'protocol', self._get_wm_widget(), 'WM_TAKE_FOCUS',
-            teek.create_command(self.on_take_focus.run))
+            teek.create_command(self.on_take_focus.run,
+                                stats_key=self.on_take_focus._stats_key))
 
     def _repr_parts(self):
         result = ['title=' + repr(self.title)]
@@ -277,6 +279,25 @@ class FallbackConfigDict(ConfigDict):
         else:
             return self._fallback_config._get(option)
 
+    def _set_many(self, options):
+        main_options = {}
+        fallback_options = {}
+        for option, value in options.items():
+            if option in self._main_config._list_options():
+                main_options[option] = value
+            else:
+                fallback_options[option] = value
+
+        if main_options:
+            self._main_config._set_many(main_options)
+        if fallback_options:
+            self._fallback_config._set_many(fallback_options)
+
+    def _get_all(self):
+        result = self._fallback_config._get_all()
+        result.update(self._main_config._get_all())
+        return result
+
     def _list_options(self):
         return (set(self._main_config._list_options()) |
                 set(self._fallback_config._list_options()))
@@ -336,9 +357,6 @@ class Window(WmMixin, Widget):
         """
         self.toplevel.destroy()
 
-    def _destroy_recurser(self):
-        super().destroy()
-
     def _init_config(self):
         # if you change these, also change Frame's types in misc.py
         self.config._types.update({
@@ -0,0 +1,92 @@
+import teek
+
+# everything is done in one Tcl call, so appending from a thread puts only one
+# item to the queue, and nothing can run between checking whether the view is
+# at the bottom and scrolling it back there
+#
+# the line of 'end - 2 chars' is the number of lines, not counting an empty
+# line after a trailing newline
+_APPEND_LAMBDA = '''{widget max_lines keep_lines args} {
+    set at_bottom [expr {[lindex [$widget yview] 1] == 1.0}]
+    set state [$widget cget -state]
+    if {$state eq "disabled"} {
+        $widget configure -state normal
+    }
+
+    $widget insert {end - 1 char} {*}$args
+    set lines [lindex [split [$widget index {end - 2 chars}] .] 0]
+    if {$lines > $max_lines} {
+        $widget delete 1.0 [expr {$lines - $keep_lines + 1}].0
+    }
+
+    if {$state eq "disabled"} {
+        $widget configure -state disabled
+    }
+    if {$at_bottom} {
+        $widget yview moveto 1.0
+    }
+}'''
+
+
+class LogText(teek.Text):
+    """A :class:`teek.Text` widget that doesn't grow forever.
+
+    This is meant to be used for displaying log messages of programs that run
+    for a long time. If the widget has more than ``max_lines`` lines of text
+    after :meth:`append` or :meth:`append_many`, the oldest lines are
+    deleted. Deleting one line at a time would be slow, so the lines are
+    deleted in chunks of ``trim_lines`` lines; after trimming, the widget
+    contains ``max_lines - trim_lines`` lines. The default ``trim_lines`` is
+    10% of ``max_lines``.
+
+    If the widget is scrolled all the way down when text is appended, it
+    scrolls down to show the new text. Otherwise the user is probably reading
+    something, and the widget doesn't scroll.
+
+    Appending works even if the widget has ``state='disabled'``, so you can
+    use that to prevent the user from editing the log.
+
+    Other keyword arguments are passed to :class:`teek.Text`. For example::
+
+        from teek.extras.log_text import LogText
+
+        log = LogText(window, max_lines=5000, state='disabled')
+        log.append('Starting...\\n')
+
+    .. note::
+        Only :meth:`append` and :meth:`append_many` trim the text. Text added
+        with other methods, such as :meth:`~teek.Text.insert`, is deleted
+        later when it becomes old enough.
+    """
+
+    def __init__(self, parent, max_lines=10000, *, trim_lines=None, **kwargs):
+        if trim_lines is None:
+            trim_lines = max_lines // 10
+        if max_lines < 1:
+            raise ValueError("max_lines must be positive, not %r"
+                             % (max_lines,))
+        if not 0 <= trim_lines < max_lines:
+            raise ValueError(
+                "trim_lines must be at least 0 and less than max_lines, "
+                "not %r" % (trim_lines,))
+
+        super().__init__(parent, **kwargs)
+        self._max_lines = max_lines
+        self._keep_lines = max_lines - trim_lines
+
+    def append(self, text, tag_list=()):
+        """Like :meth:`teek.Text.append`, but trims and scrolls as explained
+        above.
+        """
+        self.append_many([(text, tag_list)])
+
+    def append_many(self, text_and_tags):
+        """Like :meth:`teek.Text.append_many`, but trims and scrolls as
+        explained above.
+        """
+        args = []
+        for text, tag_list in text_and_tags:
+            args.extend([text, tag_list])
+        if args:
+            self._call(None, 'apply', _APPEND_LAMBDA, self,
+                       self._max_lines, self._keep_lines, *args)
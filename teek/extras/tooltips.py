@@ -8,9 +8,9 @@ class _TooltipManager:
     tipwindow = None
 
     def __init__(self, widget: teek.Widget):
-        widget.bind('<Enter>', self.enter, event=True)
-        widget.bind('<Leave>', self.leave, event=True)
-        widget.bind('<Motion>', self.motion, event=True)
+        widget.bind('<Enter>', self.enter, event=['widget', 'rootx', 'rooty'])
+        widget.bind('<Leave>', self.leave, event=['widget'])
+        widget.bind('<Motion>', self.motion, event=['rootx', 'rooty'])
         self.widget = widget
         self.got_mouse = False
         self.text = None
@@ -77,7 +77,7 @@ def check_config_types():
     def checker(config, debug_info, *, ignore_list=()):
         # this converts all values to their types, and this probably fails if
         # the types are wrong
-        dict(config)
+        assert config.snapshot() == dict(config)
 
         complained = set()
 
@@ -142,3 +142,27 @@ def fake_command():
             teek.tcl_call(None, 'rename', name + '_real', name)
 
     return faker
+
+
+@pytest.fixture
+def record_stats():
+    """Record stats in a with statement.
+
+    The dict that the with statement gives is empty until the with statement
+    ends, and then it's filled with what :func:`teek.stats` returns:
+
+        with record_stats() as stats:
+            do_something()
+        assert stats['tcl_calls']['pathName configure']['count'] == 1
+    """
+    @contextlib.contextmanager
+    def recorder():
+        stats = {}
+        teek.enable_stats()
+        try:
+            yield stats
+        finally:
+            teek.disable_stats()
+            stats.update(teek.stats())
+
+    return recorder
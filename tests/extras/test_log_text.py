@@ -0,0 +1,76 @@
+import pytest
+
+import teek
+from teek.extras.log_text import LogText
+
+
+def test_trimming():
+    log = LogText(teek.Window(), max_lines=10, trim_lines=3)
+    for i in range(1, 11):
+        log.append('line %d\n' % i)
+    assert log.get().splitlines() == ['line %d' % i for i in range(1, 11)]
+
+    log.append('line 11\n')
+    assert log.get().splitlines() == ['line %d' % i for i in range(5, 12)]
+
+    log.append_many(('line %d\n' % i, []) for i in range(12, 100))
+    assert len(log.get().splitlines()) == 7
+    assert log.get().splitlines()[-1] == 'line 99'
+
+    # no newline at end works too
+    log.append('asd')
+    assert len(log.get().splitlines()) == 8
+
+
+def test_one_call_and_tags(record_stats):
+    log = LogText(teek.Window())
+    tag = log.get_tag('error')
+
+    with record_stats() as stats:
+        log.append_many([('hello\n', []), ('world\n', [tag])])
+        log.append_many([])
+    assert stats['tcl_calls'].keys() == {'apply'}
+    assert stats['tcl_calls']['apply']['count'] == 1
+
+    assert log.get() == 'hello\nworld\n'
+    assert tag.ranges() == [((2, 0), (3, 0))]
+
+
+def test_disabled():
+    log = LogText(teek.Window(), state='disabled')
+    log.append('hello')
+    assert log.get() == 'hello'
+    assert log.config['state'] == 'disabled'
+
+
+def test_autoscroll():
+    log = LogText(teek.Window(), height=5)
+    log.pack()
+    log.append_many(('line %d\n' % i, []) for i in range(100))
+    teek.update()
+    assert log.yview()[1] == 1.0
+
+    log.yview('moveto', 0)
+    teek.update()
+    log.append('more\n')
+    teek.update()
+    assert log.yview()[0] == 0.0
+
+    log.yview('moveto', 1)
+    teek.update()
+    log.append('more\n')
+    teek.update()
+    assert log.yview()[1] == 1.0
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError) as error:
+        LogText(teek.Window(), max_lines=0)
+    assert str(error.value) == "max_lines must be positive, not 0"
+
+    for trim_lines in [-1, 10]:
+        with pytest.raises(ValueError) as error:
+            LogText(teek.Window(), max_lines=10, trim_lines=trim_lines)
+        assert str(error.value) == (
+            "trim_lines must be at least 0 and less than max_lines, not %d"
+            % trim_lines)
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+import pytest
+
+import teek
+
+
+def test_async_run():
+    events = []
+
+    async def main():
+        loop = asyncio.get_event_loop()
+
+        # tk callbacks can give values to coroutines
+        future = loop.create_future()
+        teek.after(10, future.set_result, ['from tk'])
+        events.append(await future)
+
+        await asyncio.sleep(0.01)
+        events.append('slept')
+
+        # so can other threads, without init_threads()
+        result = await loop.run_in_executor(None, threading.get_ident)
+        assert result != threading.get_ident()
+        events.append('executor')
+
+        return 'done'
+
+    assert teek.async_run(main()) == 'done'
+    assert events == ['from tk', 'slept', 'executor']
+
+
+def test_async_run_quit():
+    async def main():
+        teek.after(10, teek.quit)
+        await asyncio.sleep(60)
+
+    assert teek.async_run(main()) is None
+
+
+def test_async_run_error():
+    async def main():
+        await asyncio.sleep(0)
+        raise ValueError("oh no")
+
+    with pytest.raises(ValueError, match=r'^oh no$'):
+        teek.async_run(main())
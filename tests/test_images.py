@@ -47,6 +47,19 @@ def test_config(check_config_types):
     check_config_types(teek.Image(file=SMILEY_PATH).config, 'Image')
 
 
+def test_options_are_listed_once(record_stats):
+    teek.Image().config['width'] = 1
+    image = teek.Image()
+
+    with record_stats() as stats:
+        image.config['width'] = 2
+        assert image.config['width'] == 2
+
+    # image commands don't have subcommands in stats, so the configure for
+    # setting the width and the cget are counted together
+    assert stats['tcl_calls'][image.to_tcl()]['count'] == 2
+
+
 @pytest.mark.slow
 def test_data_base64():
     with open(SMILEY_PATH, 'rb') as file:
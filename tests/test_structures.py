@@ -56,6 +56,29 @@ def test_callbacks(capsys):
     assert '\n    cb.connect(broken_callback)\n' in errors
 
 
+def test_capture_stack_traces(capsys):
+    def broken_callback():
+        1 / 0
+
+    teek.capture_stack_traces(False)
+    try:
+        cb = teek.Callback()
+        cb.connect(broken_callback)
+        command = teek.create_command(broken_callback)
+    finally:
+        teek.capture_stack_traces()
+
+    cb.run()
+    teek.tcl_call(None, command)
+    teek.delete_command(command)
+
+    output, errors = capsys.readouterr()
+    assert not output
+    assert errors.count('ZeroDivisionError') == 2
+    assert 'cb.connect(broken_callback)' not in errors
+    assert 'teek.create_command(broken_callback)' not in errors
+
+
 def test_callback_break(capsys):
     stuff = []
 
@@ -92,7 +115,7 @@ def test_callback_break(capsys):
 
 
 # most things are tested with doctests, but this is for testing corner cases
-def test_colors():
+def test_colors(record_stats):
     # these must work
     teek.Color(1, 2, 255)
     teek.Color(1, 2, 0)
@@ -123,6 +146,23 @@ def test_colors():
     with pytest.raises(KeyError):
         the_dict[white]
 
+    # these don't need tcl, and blue has been looked up already
+    with record_stats() as stats:
+        assert teek.Color('#0000FF') == blue1
+        assert teek.Color('#00000ffff') == blue1
+        assert teek.Color('#00000000ffff') == blue1
+        assert teek.Color('#12345689a').to_tcl() == '#12345689a'
+        assert teek.Color('#12345689a') == teek.Color(0x12, 0x45, 0x89)
+        assert teek.Color('blue') == blue1
+    assert 'winfo rgb' not in stats['tcl_calls']
+
+    with pytest.raises(teek.TclError):
+        teek.Color('#asdasd')
+
+    # $ would match before the newline, but tk doesn't allow it
+    with pytest.raises(teek.TclError):
+        teek.Color('#ff0000\n')
+
 
 def test_screen_distances():
     assert teek.ScreenDistance(123).pixels == 123
@@ -164,3 +204,23 @@ def test_screen_distances():
 
     with pytest.raises(teek.TclError):
         teek.ScreenDistance('asdf asdf')
+
+
+def test_screen_distance_caching(record_stats):
+    with record_stats() as stats:
+        # these round like tk does
+        assert teek.ScreenDistance(12.5).pixels == 13
+        assert teek.ScreenDistance('-12.5').pixels == -13
+        assert teek.ScreenDistance('12.4').fpixels == 12.4
+
+        assert teek.ScreenDistance('7.5p') == teek.ScreenDistance('7.5p')
+    assert stats['tcl_calls']['winfo pixels']['count'] == 1
+
+    old_scaling = teek.tcl_call(float, 'tk', 'scaling')
+    try:
+        teek.tcl_call(None, 'tk', 'scaling', 1)
+        assert round(teek.ScreenDistance('7.5p').fpixels, 3) == 7.5
+        teek.tcl_call(None, 'tk', 'scaling', 2)
+        assert round(teek.ScreenDistance('7.5p').fpixels, 3) == 15.0
+    finally:
+        teek.tcl_call(None, 'tk', 'scaling', old_scaling)
@@ -1,5 +1,8 @@
 import collections.abc
+import gc
+import json
 import platform
+import weakref
 
 import pytest
 
@@ -119,6 +122,107 @@ def test_eval_and_call(handy_commands, capfd):
     assert capfd.readouterr() == ('', '')
 
 
+def test_nested_type_specs():
+    # the same type specs are compiled only once, but they don't need to be
+    # the same objects
+    for i in range(3):
+        assert teek.tcl_eval([(str, int)], 'list {a 1} {b 2}') == [
+            ('a', 1), ('b', 2)]
+        assert teek.tcl_eval({'a': [int]}, 'dict create a {1 2} b {3 4}') == {
+            'a': [1, 2], 'b': '3 4'}
+
+    with pytest.raises(TypeError):
+        teek.tcl_eval([object()], 'list 1 2')
+
+
+def test_native_results():
+    # _tkinter returns these as tuples, ints, floats and bools
+    assert teek.tcl_eval([int], 'list [expr 1] [expr 0x10] 0b11') == [1, 16, 3]
+    assert teek.tcl_eval([float], 'list [expr 1.5] [expr 2] 3') == [
+        1.5, 2.0, 3.0]
+    assert teek.tcl_eval([bool], 'list [expr 1 == 1] [expr 0] 0 1 yes') == [
+        True, False, False, True, True]
+    assert teek.tcl_eval([[int]], 'list [list 1 2] [list 3]') == [[1, 2], [3]]
+    assert teek.tcl_eval((str, [str]), 'list a [list b c]') == (
+        'a', ['b', 'c'])
+    assert teek.tcl_eval([str], 'list') == []
+
+
+def test_native_list_items_to_strings(monkeypatch):
+    class FromTcl:
+        @classmethod
+        def from_tcl(cls, string):
+            return string + '!'
+
+    interp = teek._tcl_calls._get_interp()
+    real_call_thread_safely = interp.call_thread_safely
+    calls = []
+
+    def call_thread_safely(*args, **kwargs):
+        calls.append(args)
+        return real_call_thread_safely(*args, **kwargs)
+
+    monkeypatch.setattr(interp, 'call_thread_safely', call_thread_safely)
+
+    # the items are ints, and converting them one by one would need a
+    # 'format %s' call for each item
+    code = 'lmap x [lrepeat 1000 1] {expr {$x + 1}}'
+    assert teek.tcl_eval([str], code) == ['2'] * 1000
+    assert len(calls) <= 3
+    calls.clear()
+    assert teek.tcl_eval([FromTcl], code) == ['2!'] * 1000
+    assert len(calls) <= 3
+    calls.clear()
+    assert teek.tcl_eval((str, int), 'list [expr 1] [expr 2]') == ('1', 2)
+    assert len(calls) <= 3
+
+
+def test_converters_of_per_widget_classes_are_not_cached_globally():
+    # like Text.TextIndex, see _find_class_cache() in _tcl_calls.py
+    class Thing:
+        _teek_converters = {}
+
+        @classmethod
+        def from_tcl(cls, string):
+            return cls()
+
+        def to_tcl(self):
+            return 'thing'
+
+    assert isinstance(teek.tcl_call(Thing, 'list', Thing()), Thing)
+    assert teek.tcl_call([Thing], 'list', Thing(), Thing())[0].to_tcl() == (
+        'thing')
+    assert teek.tcl_call((Thing, int), 'list', 'a', 1)[1] == 1
+    assert len(Thing._teek_converters) == 4
+
+    thing_ref = weakref.ref(Thing)
+    del Thing
+    gc.collect()
+    assert thing_ref() is None
+
+
+def test_to_tcl_types():
+    class StrSubclass(str):
+        pass
+
+    class HasToTcl:
+        def to_tcl(self):
+            return 'lol'
+
+    assert teek.tcl_call(str, 'format', '%s', StrSubclass('a b')) == 'a b'
+    assert teek.tcl_call(
+        [str], 'list', HasToTcl(), None, False, 1.5, 2) == [
+            'lol', '', '0', '1.5', '2']
+
+    coords = [1, 2.5] * 1000
+    assert teek.tcl_call([float], 'list', *coords) == coords
+    assert teek.tcl_call([str], 'format', '%s', coords) == list(
+        map(str, coords))
+    assert teek.tcl_call([str], 'format', '%s', [1, True, 'x']) == [
+        '1', '1', 'x']
+    assert teek.tcl_call([str], 'format', '%s', iter([1, 2])) == ['1', '2']
+
+
 # this was a fun bug: tkinter returns tuples for some things, and the
 # empty tuple was handled differently for some reason, but the only way
 # to get tkinter to return an empty tuple i found is tk_getSaveFile when
@@ -228,6 +332,72 @@ def test_before_after_quit():
     assert asd == ['one', 'two', 'three']
 
 
+def test_batch(fake_command):
+    with fake_command('puts') as called:
+        with teek.batch():
+            teek.tcl_call(None, 'puts', 'a')
+            teek.tcl_call(None, 'puts', 'b')
+            with teek.batch():
+                teek.tcl_call(None, 'puts', 'c')
+            assert called == []
+        assert called == [['a'], ['b'], ['c']]
+        called.clear()
+
+        # calls whose return value is needed can't be batched
+        with teek.batch():
+            teek.tcl_call(None, 'puts', 'a')
+            assert teek.tcl_call(str, 'puts', 'b') == ''
+            assert called == [['a'], ['b']]
+            teek.tcl_call(None, 'puts', 'c')
+            teek.tcl_eval(None, 'puts d')
+            assert called == [['a'], ['b'], ['c'], ['d']]
+
+    with pytest.raises(teek.TclError):
+        with teek.batch():
+            teek.tcl_call(None, 'set', 'batch_test', 'a')
+            teek.tcl_call(None, 'expr', '1/0')
+            teek.tcl_call(None, 'set', 'batch_test', 'b')
+    assert teek.tcl_call(str, 'set', 'batch_test') == 'a'
+
+    # the calls are not done if the with block fails, so the ZeroDivisionError
+    # isn't hidden by the TclError that 'expr 1/0' would give
+    with pytest.raises(ZeroDivisionError):
+        with teek.batch():
+            teek.tcl_call(None, 'set', 'batch_test', 'c')
+            teek.tcl_call(None, 'expr', '1/0')
+            1 / 0
+    assert teek.tcl_call(str, 'set', 'batch_test') == 'a'
+
+    # the next batch doesn't do the thrown away calls either
+    with teek.batch():
+        teek.tcl_call(None, 'set', 'batch_test', 'd')
+    assert teek.tcl_call(str, 'set', 'batch_test') == 'd'
+
+
+def test_batch_and_deleting_commands(handy_callback):
+    @handy_callback
+    def on_destroy():
+        pass
+
+    # destroy() deletes the commands of the widget, and the batched destroy
+    # must run the <Destroy> binding before that
+    label = teek.Label(teek.Window())
+    label.bind('<Destroy>', on_destroy)
+    with teek.batch():
+        label.destroy()
+    assert on_destroy.ran_once()
+
+
+def test_quit_in_batch():
+    teek.tcl_call(None, 'set', 'batch_test', 'a')
+    with teek.batch():
+        teek.tcl_call(None, 'set', 'batch_test', 'b')
+        teek.quit()
+
+    # the set call must not create a new interpreter
+    assert teek._tcl_calls._interp is None
+
+
 def test_update_idletasks(fake_command):
     with fake_command('update') as called:
         teek.update(idletasks_only=True)
@@ -251,3 +421,148 @@ def test_weird_error(capfd):
     teek.quit()
     teek.update()
     assert capfd.readouterr() == ('', '')
+
+
+def test_stats():
+    nothing = {'tcl_calls': {}, 'commands': {}, 'thread_calls': {}}
+    assert teek.stats() == nothing
+
+    def callback(arg):
+        return arg * 2
+
+    teek.enable_stats()
+    try:
+        teek.tcl_call(None, 'set', 'stats_test', 'a')
+        assert teek.tcl_call(str, 'set', 'stats_test') == 'a'
+        teek.tcl_call(None, 'wm', 'title', '.', 'hello')
+        teek.tcl_eval(None, 'set stats_test b')
+        with teek.batch():
+            teek.tcl_call(None, 'set', 'stats_test', 'c')
+
+        command = teek.create_command(callback, [int])
+        assert teek.tcl_call(int, command, 2) == 4
+        teek.delete_command(command)
+    finally:
+        teek.disable_stats()
+
+    # stats are no longer recorded
+    teek.tcl_call(None, 'set', 'stats_test', 'd')
+
+    result = teek.stats()
+    assert json.loads(json.dumps(result)) == result
+
+    calls = result['tcl_calls']
+    assert calls['set']['count'] == 3
+    assert calls['wm title']['count'] == 1
+    assert calls['tcl_eval']['count'] == 1
+    assert calls['teek.batch()']['count'] == 1
+    assert calls['teek_command']['count'] == 1
+    for call_stats in calls.values():
+        assert set(call_stats.keys()) == {'count', 'python_time', 'tcl_time'}
+        for times in [call_stats['python_time'], call_stats['tcl_time']]:
+            assert 0 <= times['max'] <= times['total']
+
+    [(name, command_stats)] = result['commands'].items()
+    assert name.endswith('test_stats.<locals>.callback')
+    assert command_stats['count'] == 1
+
+    teek.enable_stats()
+    teek.disable_stats()
+    assert teek.stats() == nothing
+
+
+def test_stats_with_command_dispatcher(record_stats):
+    def callback(arg):
+        return arg * 2
+
+    teek.use_command_dispatcher()
+    try:
+        command = teek.create_command(callback, [int])
+        with record_stats() as stats:
+            assert teek.tcl_call(int, *command.split(), 2) == 4
+        teek.delete_command(command)
+    finally:
+        teek.use_command_dispatcher(False)
+
+    assert stats['tcl_calls'].keys() == {'teek_command'}
+    assert stats['tcl_calls']['teek_command']['count'] == 1
+    [name] = stats['commands'].keys()
+    assert name.endswith('.<locals>.callback')
+
+
+def test_stats_keys(record_stats):
+    def on_click():
+        pass
+
+    def on_event():
+        pass
+
+    def on_timeout():
+        pass
+
+    button = teek.Button(teek.Window(), command=on_click)
+    button.bind('<<Asd>>', on_event)
+    button.bind('<<Coalesced>>', on_event, coalesce=True)
+
+    with record_stats() as stats:
+        button.invoke()
+        teek.tcl_call(None, 'event', 'generate', button, '<<Asd>>')
+        teek.tcl_call(None, 'event', 'generate', button, '<<Coalesced>>')
+        teek.after_idle(on_timeout)
+        teek.update()
+
+    # teek's own wrapper functions must not show up
+    commands = stats['commands']
+    assert not any(key.startswith('teek.') for key in commands)
+
+    def key(func):
+        return func.__module__ + '.' + func.__qualname__
+
+    assert commands[key(on_click)]['count'] == 1
+    assert commands[key(on_timeout)]['count'] == 1
+    # 2 bindings and the timeout that the coalescing binding creates
+    assert commands[key(on_event)]['count'] == 3
+
+
+def test_command_dispatcher(capfd):
+    old_command = teek.create_command(print, [str])
+    teek.use_command_dispatcher()
+    try:
+        result = []
+        command = teek.create_command(result.append, [int])
+        assert command.startswith('teek_dispatch ')
+        assert command not in teek.tcl_call([str], 'info', 'commands')
+
+        teek.tcl_call(None, *command.split(), '123')
+        teek.tcl_eval(None, '%s 456' % command)
+        teek.tcl_call(None, old_command, 'old command still works')
+        assert result == [123, 456]
+
+        teek.delete_command(command)
+        teek.delete_command(old_command)
+        with pytest.raises(teek.TclError):
+            teek.delete_command(command)
+
+        teek.tcl_eval(None, '%s 789' % command)
+        assert result == [123, 456]
+        output, errors = capfd.readouterr()
+        assert output.replace('\r\n', '\n') == 'old command still works\n'
+        assert errors == 'teek: invalid command name "%s"\n' % command
+
+        # widgets use create_command a lot
+        window = teek.Window()
+        window.bind('<<Test>>', result.append, event=True)
+        teek.tcl_call(None, 'event', 'generate', window, '<<Test>>')
+        assert len(result) == 3
+
+        # the text widget runs a command from Tcl code when it changes
+        text = teek.Text(window)
+        text.insert(text.end, 'hello')
+        assert text.end == (1, 5)
+        text.append('\nworld')
+        assert text.end == (2, 5)
+        window.destroy()
+    finally:
+        teek.use_command_dispatcher(False)
+
+    assert teek.create_command(print).startswith('teek_command_')
@@ -1,5 +1,6 @@
 import functools
 import re
+import sys
 import threading
 import traceback
 
@@ -52,6 +53,158 @@ def test_basic_stuff(deinit_threads, handy_callback):
     assert done_callback.ran_once()
 
 
+@pytest.mark.slow
+def test_batch(deinit_threads, handy_callback):
+    teek.init_threads()
+    text = teek.Text(teek.Window())
+
+    def thread_target():
+        with teek.batch():
+            for i in (1, 2, 3):
+                teek.tcl_call(None, text, 'insert', 'end - 1 char',
+                              'hello %d\n' % i)
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+
+    @handy_callback
+    def done_callback():
+        assert text.get(text.start, text.end) == 'hello 1\nhello 2\nhello 3\n'
+        teek.quit()
+
+    teek.after(500, done_callback)
+    teek.run()
+    thread.join()
+    assert done_callback.ran_once()
+
+
+@pytest.mark.slow
+def test_batch_with_widget_methods(deinit_threads, handy_callback,
+                                   record_stats):
+    teek.init_threads()
+    window = teek.Window()
+    label = teek.Label(window)
+    text = teek.Text(window)
+    assert label.config['text'] == ''   # asks the option names from tk
+
+    def thread_target():
+        with teek.batch():
+            for i in range(10):
+                label.config['text'] = 'hello %d' % i
+            label.config.update({'width': 20, 'anchor': 'center'})
+            text.append('hello')
+            text.append_many([(' ', []), ('world', [])])
+
+    @handy_callback
+    def done_callback():
+        assert label.config['text'] == 'hello 9'
+        assert label.config['width'] == teek.ScreenDistance(20)
+        assert label.config['anchor'] == 'center'
+        assert text.get() == 'hello world'
+        teek.quit()
+
+    with record_stats() as stats:
+        thread = threading.Thread(target=thread_target)
+        thread.start()
+        teek.after(500, done_callback)
+        teek.run()
+        thread.join()
+    assert done_callback.ran_once()
+
+    # everything was put to the queue as one item
+    assert stats['thread_calls']['wait']['count'] == 1
+
+
+@pytest.mark.slow
+def test_batch_order_with_thread_safe_functions(deinit_threads,
+                                                handy_callback):
+    teek.init_threads()
+    label = teek.Label(teek.Window(), text='old')
+    results = []
+
+    @teek.make_thread_safe
+    def get_variable():
+        return teek.tcl_call(str, 'set', 'batch_order_test')
+
+    @handy_callback
+    def thread_target():
+        teek.tcl_call(None, 'set', 'batch_order_test', 'old')
+        with teek.batch():
+            # the batched calls must run before the things that are not
+            # batched, even though those run in the event loop
+            teek.tcl_call(None, 'set', 'batch_order_test', 'new')
+            results.append(get_variable())
+            teek.tcl_call(None, label, 'configure', '-text', 'new')
+            results.append(label.config['text'])
+            teek.tcl_call(None, label, 'configure', '-text', 'newer')
+            results.append(teek.call_async(label.config.__getitem__,
+                                           ['text']).result())
+            teek.tcl_call(None, label, 'configure', '-text', 'newest')
+            teek.call_soon_threadsafe(results.append, ['soon'])
+            results.append(label.config['text'])
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+    teek.after(1000, teek.quit)
+    teek.run()
+    thread.join()
+    assert thread_target.ran_once()
+    assert results == ['new', 'new', 'newer', 'soon', 'newest']
+
+
+@pytest.mark.slow
+def test_batch_append_and_add_ranges(deinit_threads, handy_callback):
+    teek.init_threads()
+    text = teek.Text(teek.Window())
+    tag = text.get_tag('asd')
+    text.append('hello')
+    assert text.end == (1, 5)
+
+    def thread_target():
+        with teek.batch():
+            text.append('\nworld')
+            # this must not clamp the indexes to the old end
+            tag.add_ranges([((1, 0), (1, 5)), ((2, 0), (2, 5))])
+
+    @handy_callback
+    def done_callback():
+        assert text.get() == 'hello\nworld'
+        assert tag.ranges() == [((1, 0), (1, 5)), ((2, 0), (2, 5))]
+        teek.quit()
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+    teek.after(500, done_callback)
+    teek.run()
+    thread.join()
+    assert done_callback.ran_once()
+
+
+@pytest.mark.skipif(sys.platform == 'win32',
+                    reason="createfilehandler doesn't exist on windows")
+def test_wakeup_without_polling(deinit_threads, handy_callback):
+    teek.init_threads(poll_interval_ms=None)
+    text = teek.Text(teek.Window())
+
+    def thread_target():
+        for i in range(100):
+            text.insert(text.end, 'x')
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+
+    # 100 calls would take at least 5 seconds with the 50ms poller
+    @handy_callback
+    def done_callback():
+        assert text.get(text.start, text.end) == 'x' * 100 + '\n'
+        teek.quit()
+
+    teek.after(2000, done_callback)
+    teek.run()
+    thread.join()
+    assert done_callback.ran_once()
+
+
 def test_init_threads_errors(deinit_threads, handy_callback):
     @handy_callback
     def thread1_target():
@@ -156,3 +309,57 @@ def test_quitting_from_another_thread(handy_callback):
     thread.start()
     thread.join()
     assert thread_target.ran_once()
+
+
+@pytest.mark.slow
+def test_call_soon_threadsafe_and_call_async(deinit_threads, handy_callback):
+    teek.init_threads()
+    text = teek.Text(teek.Window())
+    futures = []
+
+    def thread_target():
+        for i in (1, 2, 3):
+            teek.call_soon_threadsafe(
+                text.insert, (text.end, 'hello %d\n' % i))
+        futures.append(teek.call_async(text.get, (text.start, text.end)))
+        futures.append(teek.call_async(int, ('lol',)))
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+
+    @handy_callback
+    def done_callback():
+        assert futures[0].result() == 'hello 1\nhello 2\nhello 3\n'
+        with pytest.raises(ValueError):
+            futures[1].result()
+        teek.quit()
+
+    teek.after(500, done_callback)
+    teek.run()
+    thread.join()
+    assert done_callback.ran_once()
+
+
+def test_call_soon_threadsafe_and_call_async_in_main_thread(capsys):
+    result = []
+    teek.call_soon_threadsafe(result.append, ['a'])
+    assert result == ['a']
+
+    teek.call_soon_threadsafe(int, ['lol'])
+    assert 'ValueError' in capsys.readouterr().err
+
+    future = teek.call_async(dict, kwargs={'a': 1})
+    assert future.done()
+    assert future.result() == {'a': 1}
+
+
+@pytest.mark.skipif(sys.platform == 'win32',
+                    reason="createfilehandler doesn't exist on windows")
+def test_wakeup_without_polling_quit_twice(capsys):
+    teek.tcl_call(None, 'set', 'make_sure_that_interpreter_exists', 'yes')
+    old_connections = len(teek.before_quit._connections)
+    for i in range(2):
+        teek.init_threads(poll_interval_ms=None)
+        teek.quit()
+        assert len(teek.before_quit._connections) == old_connections
+    assert capsys.readouterr() == ('', '')
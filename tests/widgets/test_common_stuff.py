@@ -2,6 +2,7 @@ import collections.abc
 import contextlib
 import os
 import re
+import time
 
 import pytest
 
@@ -141,6 +142,24 @@ def test_destroy():
     assert str(error.value) == 'the widget has been destroyed'
 
 
+def test_destroy_many_widgets(record_stats):
+    window = teek.Window()
+    frames = [teek.Frame(window) for junk in range(10)]
+    labels = [teek.Label(frame) for frame in frames for junk in range(10)]
+    for label in labels:
+        label.bind('<Button-1>', print)
+
+    with record_stats() as stats:
+        window.destroy()
+    assert stats['tcl_calls'].keys() == {'destroy'}
+
+    for widget in [window, window.toplevel] + frames + labels:
+        assert not widget.winfo_exists()
+        assert not widget.command_list
+        with pytest.raises(KeyError):
+            teek.Widget.from_tcl(widget.to_tcl())
+
+
 def test_destroy_with_widget_not_created_in_teek():
     window = teek.Window()
     label_name = window.to_tcl() + '.asd'
@@ -209,6 +228,92 @@ def test_options():
     assert widget1.config != widget2.config
 
 
+def test_options_when_creating(record_stats):
+    window = teek.Window()
+
+    # -class can't be changed after creating the widget
+    frame = teek.Frame(window, class_='LolFrame')
+    assert frame.config['class'] == 'LolFrame'
+    assert teek.tcl_call(str, 'winfo', 'class', frame) == 'LolFrame'
+
+    # tk accepts -tex, so that label gets created and must be destroyed
+    widget_count = len(teek._widgets.base._widgets)
+    for bad_kwargs in [{'asd': 'toot'}, {'tex': 'toot'}]:
+        with pytest.raises(KeyError) as error:
+            teek.Label(window, **bad_kwargs)
+        assert error.value.args == tuple(bad_kwargs)
+
+        # the widget is created right away in a batch, so this works there too
+        with pytest.raises(KeyError) as error:
+            with teek.batch():
+                teek.tcl_call(None, 'set', 'creating_test', 'done')
+                teek.Label(window, **bad_kwargs)
+        assert error.value.args == tuple(bad_kwargs)
+        assert teek.tcl_call(str, 'set', 'creating_test') == 'done'
+        teek.tcl_call(None, 'unset', 'creating_test')
+
+    # canvas uses tk's old option code, and -h could be -height or
+    # -highlightcolor etc
+    with pytest.raises(KeyError) as error:
+        teek.Canvas(window, h=123)
+    assert error.value.args == ('h',)
+
+    assert window.winfo_children() == [frame]
+    assert window._children == {frame}
+    assert len(teek._widgets.base._widgets) == widget_count
+
+    with pytest.raises(ValueError) as error:
+        teek.Entry(window, xscrollcommand=print)
+    assert "cannot set the value of 'xscrollcommand'" in str(error.value)
+
+    with record_stats() as stats:
+        teek.Label(window, text='hello', anchor='center')
+    assert 'pathName configure' not in stats['tcl_calls']
+
+
+def test_options_are_listed_once(record_stats):
+    window = teek.Window()
+    label = teek.Label(window, 'hello')
+    other_label = teek.Label(window)
+
+    with record_stats() as stats:
+        label.config['text'] = 'a'
+        assert label.config['text'] == 'a'
+        assert other_label.config['text'] == ''
+
+        teek.Label.forget_config_options()
+        label.config['text'] = 'b'
+
+    # 2 for setting the text, 1 for asking the options again
+    tcl_calls = stats['tcl_calls']
+    assert tcl_calls['pathName configure']['count'] == 3
+    assert tcl_calls['pathName cget']['count'] == 2
+
+
+def test_options_update_and_snapshot(record_stats):
+    window = teek.Window()
+    label = teek.Label(window)
+    window.config['menu'] = teek.Menu()     # this comes from the toplevel
+
+    # the toplevel has synonym options like -bd for -borderwidth
+    for widget in [window, label, teek.Toplevel()]:
+        assert widget.config.snapshot() == dict(widget.config)
+        assert list(widget.config.snapshot()) == list(widget.config)
+
+    with record_stats() as stats:
+        label.config.update({'text': 'hello', 'width': 10}, anchor='center')
+        snapshot = label.config.snapshot()
+
+    assert snapshot['text'] == 'hello'
+    assert snapshot['width'] == teek.ScreenDistance(10)
+    assert snapshot['anchor'] == 'center'
+    assert stats['tcl_calls']['pathName configure']['count'] == 2
+
+    with pytest.raises(KeyError):
+        label.config.update(text='lol', asd='asd')
+    assert label.config['text'] == 'hello'
+
+
 def test_bind(handy_callback):
     widget = teek.Window()
     assert not widget.bindings.keys()
@@ -292,6 +397,83 @@ def test_bind_break():
     widget.event_generate('<<Asd>>')
 
 
+def test_equivalent_sequences(record_stats):
+    widget = teek.Window()
+    for key in 'abcdefghijklmnopqrstuvwxyz':
+        widget.bind('<Control-%s>' % key, print)
+
+    callback = widget.bindings['<Button-1>']
+    assert widget.bindings['<1>'] is callback
+    assert widget.bindings['<ButtonPress-1>'] is callback
+
+    with record_stats() as stats:
+        for junk in range(10):
+            assert widget.bindings['<1>'] is callback
+    assert 'bind' not in stats['tcl_calls']
+
+
+def test_bind_coalesce_and_max_rate_hz(monkeypatch):
+    events = []
+    widget = teek.Window()
+    widget.bind('<<Asd>>', events.append, event=['data'], coalesce=True)
+    widget.bind('<<Asd>>', lambda: events.append('no event'), coalesce=True)
+    teek.update()
+
+    for number in range(5):
+        widget.event_generate('<<Asd>>', data=number)
+    assert events == []
+    teek.update()
+    assert events.pop() == 'no event'
+    assert events.pop().data(int) == 4
+    assert events == []
+
+    # the time is faked because the test machine may be slow
+    fake_time = 100
+    monkeypatch.setattr(time, 'monotonic', lambda: fake_time)
+
+    widget = teek.Window()
+    widget.bind('<<Asd>>', events.append, event=['data'], max_rate_hz=10)
+    teek.update()
+
+    # the first event runs as soon as possible
+    widget.event_generate('<<Asd>>', data=1)
+    teek.update()
+    assert [event.data(int) for event in events] == [1]
+
+    # 50ms later, it must wait 50ms more before running again
+    fake_time += 0.05
+    widget.event_generate('<<Asd>>', data=2)
+    widget.event_generate('<<Asd>>', data=3)
+    assert [event.data(int) for event in events] == [1]
+    time.sleep(0.1)
+    teek.update()
+    assert [event.data(int) for event in events] == [1, 3]
+
+    # after waiting long enough, it runs as soon as possible again
+    fake_time += 1
+    widget.event_generate('<<Asd>>', data=4)
+    teek.update()
+    assert [event.data(int) for event in events] == [1, 3, 4]
+
+    with pytest.raises(ValueError):
+        widget.bind('<<Asd>>', print, max_rate_hz=0)
+
+
+def test_coalescing_and_destroy():
+    events = []
+    window = teek.Window()
+    label = teek.Label(window)
+    window.bind('<<Asd>>', events.append, event=['data'], coalesce=True)
+    label.bind('<<Asd>>', events.append, event=['data'], max_rate_hz=10)
+    teek.update()
+
+    window.event_generate('<<Asd>>', data='a')
+    label.event_generate('<<Asd>>', data='b')
+    window.destroy()
+    teek.update()
+    assert events == []
+
+
 def test_event_objects():
     events = []
 
@@ -338,6 +520,38 @@ def test_event_objects():
     assert re.fullmatch(regex, repr(event)) is not None
 
 
+def test_event_attribute_list():
+    events = []
+    widget = teek.Window()
+    widget.bind('<<Asd>>', events.append, event=['x', 'data'])
+    widget.bind('<<Asd>>', lambda: events.append('no event'))
+    assert teek.tcl_call(str, 'bind', widget, '<<Asd>>').count('%') == 2
+
+    teek.update()
+    widget.event_generate('<<Asd>>', data='asd asd')
+    assert events.pop() == 'no event'
+    event = events.pop()
+    assert event.x == 0
+    assert event.data(str) == 'asd asd'
+    with pytest.raises(AttributeError) as error:
+        event.y
+    assert str(error.value) == "'y' was not given to bind(..., event=...)"
+    assert repr(event) == "<Event: data='asd asd'>"
+
+    # this needs all attributes, and the old tcl command is deleted
+    old_command = re.search(r'teek_command_\d+', teek.tcl_call(
+        str, 'bind', widget, '<<Asd>>')).group(0)
+    widget.bindings['<<Asd>>'].connect(events.append)
+    assert old_command not in teek.tcl_call([str], 'info', 'commands')
+    widget.event_generate('<<Asd>>', data='asd asd')
+    assert events.pop().y == 0
+    assert events.pop().y == 0
+
+    with pytest.raises(ValueError) as error:
+        widget.bind('<<Asd>>', print, event=['x', 'asd', 'lol'])
+    assert str(error.value) == "unknown event attributes: 'asd', 'lol'"
+
+
 def test_bind_deletes_tcl_commands(handy_callback):
     widget = teek.Window()
     widget.bind('<Button-1>', print)
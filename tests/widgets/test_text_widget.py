@@ -1,5 +1,7 @@
+import gc
 import itertools
 import os
+import weakref
 
 import pytest
 
@@ -67,6 +69,129 @@ def test_basic_stuff():
             text.start.forward(chars=1, lines=1))
 
 
+def test_end_caching(record_stats):
+    text = teek.Text(teek.Window(), undo=True)
+    text.insert(text.end, 'hello')
+
+    with record_stats() as stats:
+        for junk in range(10):
+            assert text.end == (1, 5)
+            text.insert(text.end, 'lol')
+            assert text.end == (1, 8)
+            text.delete((1, 5), text.end)
+
+    # 1 index call for each end after insert or delete
+    assert stats['tcl_calls']['pathName index']['count'] == 20
+
+    # changes that don't come from teek must also work
+    teek.tcl_call(None, text, 'insert', 'end - 1 char', '\nworld')
+    assert text.end == (2, 5)
+    text.config['endline'] = 2
+    assert text.end == (1, 5)
+    text.config['endline'] = ''
+    teek.tcl_call(None, text, 'edit', 'undo')
+    assert text.end == text.TextIndex.from_tcl(
+        teek.tcl_call(str, text, 'index', 'end - 1 char'))
+
+
+def test_end_with_abbreviated_subcommands():
+    text = teek.Text(teek.Window())
+    text.insert(text.end, 'hello')
+    assert text.end == (1, 5)
+
+    # tk allows abbreviating subcommands, so the cached end must be forgotten
+    teek.tcl_eval(None, '%s ins end-1c " world"' % text.to_tcl())
+    assert text.end == (1, 11)
+    teek.tcl_eval(None, '%s del 1.0 1.6' % text.to_tcl())
+    assert text.end == (1, 5)
+    teek.tcl_eval(None, '%s repl 1.0 1.5 hi' % text.to_tcl())
+    assert text.end == (1, 2)
+    teek.tcl_eval(None, '%s ins end-1c "\\nfoo"' % text.to_tcl())
+    assert text.end == (2, 3)
+    teek.tcl_eval(None, '%s conf -endline 2' % text.to_tcl())
+    assert text.end == (1, 2)
+    teek.tcl_eval(None, '%s conf -endline {}' % text.to_tcl())
+    assert text.end == (2, 3)
+
+    # ambiguous abbreviations are errors in tk, and nothing changes
+    with pytest.raises(teek.TclError):
+        teek.tcl_eval(None, '%s in end hello' % text.to_tcl())
+    assert text.end == (2, 3)
+
+
+def test_end_in_batch():
+    text = teek.Text(teek.Window())
+    tag = text.get_tag('asd')
+    with teek.batch():
+        text.insert(text.end, 'a\n')
+        text.insert(text.end, 'b\n')
+        text.append('c')
+        tag.add_ranges([((2, 0), (100, 100))])
+
+    assert text.get() == 'a\nb\nc'
+    assert tag.ranges() == [((2, 0), (3, 1))]
+
+
+def test_append(record_stats):
+    text = teek.Text(teek.Window())
+    tag = text.get_tag('asd')
+    text.append('hello')
+    text.append(' world', [tag])
+    assert text.get() == 'hello world'
+    assert tag.ranges() == [((1, 5), (1, 11))]
+
+    with record_stats() as stats:
+        text.append_many([('\nfoo', []), ('\nbar', [tag, 'sel'])])
+        text.append_many(iter([]))
+    assert stats['tcl_calls']['pathName insert']['count'] == 1
+
+    assert text.get() == 'hello world\nfoo\nbar'
+    assert text.end == (3, 3)
+    assert tag.ranges() == [((1, 5), (1, 11)), ((3, 0), (3, 3))]
+    assert text.get_tag('sel').ranges() == [((3, 0), (3, 3))]
+
+
+def test_search(record_stats):
+    text = teek.Text(teek.Window())
+    text.insert(text.end, 'foo bar\nFoo baz\nfoobar')
+
+    assert text.search('foo') == [((1, 0), 3)]
+    assert text.search('foo', (1, 1)) == [((3, 0), 3)]
+    assert text.search('foo', (1, 1), (2, 7)) == []
+    assert text.search('foo', nocase=True, all=True) == [
+        ((1, 0), 3), ((2, 0), 3), ((3, 0), 3)]
+    assert text.search('ba[rz]+', regexp=True, all=True) == [
+        ((1, 4), 3), ((2, 4), 3), ((3, 3), 3)]
+    assert text.search('o+ b', regexp=True, all=True) == [
+        ((1, 1), 4), ((2, 1), 4)]
+    assert text.search('-nocase') == []     # not treated as an option
+    assert text.search('lol', all=True) == []
+
+    result = text.search('bar', all=True)
+    assert all(isinstance(index, type(text.start)) for index, length in result)
+
+    assert text.end == (3, 6)     # make sure that end is cached
+    with record_stats() as stats:
+        text.search('o', all=True)
+    assert stats['tcl_calls'].keys() == {'apply'}
+
+
+def test_destroyed_text_widget_is_not_kept_alive():
+    text = teek.Text(teek.Window())
+    text.insert(text.end, 'hello')
+    text.get_tag('asd').add((1, 0), (1, 2))
+    assert text.get_tag('asd').ranges() == [((1, 0), (1, 2))]
+    assert text.get_tag('asd').nextrange(text.start) == ((1, 0), (1, 2))
+    text.marks['lol'] = (1, 3)
+    assert text.marks['lol'] == (1, 3)
+
+    text_ref = weakref.ref(text)
+    text.destroy()
+    del text
+    gc.collect()
+    assert text_ref() is None
+
+
 def test_tkinter_index_string_error():
     text = teek.Text(teek.Window())
     with pytest.raises(TypeError) as error:
@@ -176,6 +301,32 @@ def test_tags():
     assert {tag.name for tag in text.get_all_tags((1, 6))} == tag_names
 
 
+def test_tag_add_and_remove_ranges(record_stats):
+    text = teek.Text(teek.Window())
+    text.insert(text.end, 'abcdef\nghijkl\nmnopqr')
+    tag = text.get_tag('asd')
+
+    assert text.end == (3, 6)     # make sure that end is cached
+    with record_stats() as stats:
+        tag.add_ranges([((1, 0), (1, 2)), ((1, 4), (2, 1)),
+                        ((3, 5), (100, 100))])
+        tag.add_ranges([])
+    assert stats['tcl_calls'].keys() == {'pathName tag'}
+    assert stats['tcl_calls']['pathName tag']['count'] == 1
+    assert tag.ranges() == [((1, 0), (1, 2)), ((1, 4), (2, 1)),
+                            ((3, 5), (3, 6))]
+
+    tag.remove_ranges(iter([((1, 1), (1, 5)), (text.start.forward(lines=2),
+                                               text.end)]))
+    assert tag.ranges() == [((1, 0), (1, 1)), ((1, 5), (2, 1))]
+
+    with pytest.raises(TypeError):
+        tag.add_ranges([('1.0', '1.2')])
+    with pytest.raises(ValueError):
+        tag.add_ranges([((1, 0), (1, 2), (1, 3))])
+    assert tag.ranges() == [((1, 0), (1, 1)), ((1, 5), (2, 1))]
+
+
 def test_tag_creating_bug():
     text = teek.Text(teek.Window())
     a = text.get_tag('a')